@@ -1,6 +1,6 @@
 # ant_colony/__init__.py
 from .ant import Ant
 from .colony import Colony
-from .pheromone import initialize_pheromones, update_pheromones
+from .pheromone import PheromoneStore, initialize_pheromones, update_pheromones
 
-__all__ = ['Ant', 'Colony', 'initialize_pheromones', 'update_pheromones']
\ No newline at end of file
+__all__ = ['Ant', 'Colony', 'PheromoneStore', 'initialize_pheromones', 'update_pheromones']
\ No newline at end of file
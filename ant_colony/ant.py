@@ -1,67 +1,204 @@
 # ant_colony/ant.py
 import random
+import time
+
+import numpy as np
 
 class Ant:
-    def __init__(self, items, capacity, pheromones, alpha, beta):
+    def __init__(self, items, capacity, pheromones, alpha, beta, rng=None, table=None, metrics=None):
         self.items = items
         self.capacity = capacity
         self.pheromones = pheromones
         self.alpha = alpha  # Influence des phéromones
         self.beta = beta    # Influence de l'heuristique
+        self.rng = rng if rng is not None else random
+        self.table = table  # SelectionTable partagée (τ^α·η^β précalculés)
+        self.metrics = metrics  # ColonyMetrics de la colonie (None: pas d'instrumentation)
         self.solution = []
+        self.indices = []   # Positions des objets choisis, dans l'ordre de sélection
         self.total_weight = 0
         self.total_value = 0
+        # Roulettes de travail réutilisées d'une construction à l'autre (recopiées sur place)
+        self._sampler = None
+        self._candidate_sampler = None
+        self._ascending_sampler = None
 
     def select_item(self, available_items):
         """Sélectionne un objet basé sur les phéromones et l'heuristique"""
         if not available_items:
             return None
+        if self.metrics is not None:
+            self.metrics.count('sampling_calls')
+            self.metrics.count('feasibility_checks', len(available_items))
             
-        probabilities = []
-        for item in available_items:
-            pheromone = self.pheromones[item.id]
-            heuristic = item.value / item.weight if item.weight > 0 else 0
-            prob = (pheromone ** self.alpha) * (heuristic ** self.beta)
-            probabilities.append(prob)
+        if self.table is not None:
+            # Attractivités précalculées : il ne reste qu'à sommer et tirer
+            attractiveness = self.table.by_id
+            probabilities = [attractiveness[item.id] for item in available_items]
+        else:
+            probabilities = []
+            for item in available_items:
+                pheromone = self.pheromones[item.id]
+                heuristic = item.value / item.weight if item.weight > 0 else 0
+                prob = (pheromone ** self.alpha) * (heuristic ** self.beta)
+                probabilities.append(prob)
 
         total_prob = sum(probabilities)
         if total_prob == 0:
-            return random.choice(available_items)
+            return self.rng.choice(available_items)
 
-        # Normalisation des probabilités
-        probabilities = [p / total_prob for p in probabilities]
-        return random.choices(available_items, weights=probabilities, k=1)[0]
+        # random.choices normalise les poids lui-même
+        return self.rng.choices(available_items, weights=probabilities, k=1)[0]
 
     def construct_solution(self):
-        """Construit une solution complète pour le sac à dos"""
-        self.solution = []
-        self.total_weight = 0
-        self.total_value = 0
-        
-        available_items = self.items.copy()
-        random.shuffle(available_items)
-
-        while available_items:
-            # Filtrer les objets qui peuvent encore être ajoutés
-            feasible_items = [item for item in available_items 
-                            if self.total_weight + item.weight <= self.capacity]
-            
-            if not feasible_items:
-                break
-                
-            item = self.select_item(feasible_items)
-            if item:
-                self.solution.append(item)
-                self.total_weight += item.weight
-                self.total_value += item.value
-                available_items.remove(item)
+        """Construit une solution complète pour le sac à dos; retourne (vues Item, valeur totale)
+        La liste retournée appartient à l'appelant : les constructions suivantes ne la modifient pas"""
+        self.construct()
+        self.solution = [self.items[index] for index in self.indices]
+        return self.solution, self.total_value
+
+    def construct(self):
+        """Construit une solution sous forme de positions (indices), sans créer de vues Item
+        indices est vidé sur place à la construction suivante : le copier pour le conserver"""
+        self.reset()
+
+        if self.table is None:
+            from .tables import SelectionTable
+            self.table = SelectionTable(self.items, self.alpha, self.beta).refresh(self.pheromones)
+        table = self.table
+        weights = table.item_weights
+        values = table.item_values
+        # Instrumentation : horloge seulement si activée, compteurs en variables locales
+        clock = time.perf_counter if self.metrics is not None else None
+        self._sampling_time = 0.0
+        self._draws = 0
+        self._checks = 0
+
+        candidates = table.candidates
+        if candidates is not None:
+            # Liste de candidats : roulette sur les k objets les plus attractifs, en O(k) par fourmi
+            self._candidate_sampler = table.candidate_sampler.copy(self._candidate_sampler)
+            self._fill(self._candidate_sampler, table.candidate_weight_order, candidates,
+                       weights, values, clock)
+            # Liste épuisée : repli sur tous les objets encore faisables
+            self._fill_feasible(weights, values, clock)
+        else:
+            self._fill_all(weights, values, clock)
+
+        if self.metrics is not None:
+            metrics = self.metrics
+            metrics.add_time('sampling', self._sampling_time)
+            metrics.count('ants')
+            metrics.count('construction_steps', len(self.indices))
+            # Un tirage par étape plus le tirage final (vide) de chaque roulette, un test de seuil
+            # par tirage et par objet écarté
+            metrics.count('sampling_calls', self._draws)
+            metrics.count('feasibility_checks', self._checks)
+        return self.indices, self.total_value
+
+    def _fill(self, sampler, weight_order, positions, weights, values, clock):
+        """Ajoute des objets tirés dans sampler jusqu'à ce qu'il soit vide
+        sampler et weight_order sont indexés localement; positions[local] donne la position de l'objet"""
+        n = len(weight_order)
+        cutoff = 0  # Les objets weight_order[:cutoff] ne tiennent plus dans le sac
+        draws = 0
+        while True:
+            # Seuil glissant : la capacité résiduelle ne fait que diminuer, chaque objet
+            # trop lourd est écarté une seule fois (O(1) amorti + mise à jour de l'arbre)
+            while cutoff < n:
+                heavy = weight_order[cutoff]
+                if self.total_weight + weights[positions[heavy]] <= self.capacity:
+                    break
+                sampler.remove(heavy)
+                cutoff += 1
+
+            draws += 1
+            if clock is None:
+                local = sampler.draw(self.rng)
             else:
+                started = clock()
+                local = sampler.draw(self.rng)
+                self._sampling_time += clock() - started
+            if local is None:
                 break
+            self._take(positions[local], weights, values)
+            sampler.remove(local)
+        self._draws += draws
+        self._checks += draws + cutoff
 
-        return self.solution, self.total_value
+    def _fill_all(self, weights, values, clock):
+        """Roulette sur tous les objets encore faisables (en O(log n) par étape)"""
+        n = len(weights)
+        sampler = self._sampler = self.table.sampler.copy(self._sampler)
+        for index in self.indices:
+            sampler.remove(index)
+        self._fill(sampler, self.table.weight_order, range(n), weights, values, clock)
+
+        if sampler.count == 0:
+            # Toutes les probabilités restantes sont nulles : tirage uniforme comme select_item
+            chosen = set(self.indices)
+            while True:
+                feasible = [i for i in range(n)
+                            if i not in chosen and self.total_weight + weights[i] <= self.capacity]
+                if not feasible:
+                    break
+                index = self.rng.choice(feasible)
+                self._take(index, weights, values)
+                chosen.add(index)
+
+    def _fill_feasible(self, weights, values, clock):
+        """Repli de la liste de candidats : roulette sur tous les objets faisables non choisis
+        Dans l'ordre croissant des poids, les objets faisables forment un préfixe : le tirage est
+        restreint à ce préfixe, sans retirer un à un les objets devenus trop lourds."""
+        table = self.table
+        ascending_weights = table.ascending_weights
+        order = table.ascending_order
+        rank = table.ascending_rank
+        sampler = None
+        while True:
+            count = int(np.searchsorted(ascending_weights, self.capacity - self.total_weight, side='right'))
+            # Arrondi : le test de faisabilité fait foi
+            while count and self.total_weight + weights[order[count - 1]] > self.capacity:
+                count -= 1
+            if not count:
+                break
+            if sampler is None:
+                # Copie de la roulette seulement si la liste n'a pas rempli le sac
+                sampler = self._ascending_sampler = table.ascending_sampler.copy(self._ascending_sampler)
+                for index in self.indices:
+                    sampler.remove(rank[index])
+
+            self._draws += 1
+            self._checks += 1
+            if clock is None:
+                local = sampler.draw_prefix(self.rng, count)
+            else:
+                started = clock()
+                local = sampler.draw_prefix(self.rng, count)
+                self._sampling_time += clock() - started
+            if local is None:
+                # Toutes les probabilités restantes sont nulles : tirage uniforme comme select_item
+                chosen = set(self.indices)
+                feasible = [order[i] for i in range(count) if order[i] not in chosen]
+                if not feasible:
+                    break
+                index = self.rng.choice(feasible)
+                local = rank[index]
+            self._take(order[local], weights, values)
+            sampler.remove(local)
 
-    def reset(self):
-        """Remet à zéro la fourmi pour une nouvelle construction"""
+    def _take(self, index, weights, values):
+        """Ajoute l'objet à la position index à la solution"""
+        self.indices.append(index)
+        self.total_weight += weights[index]
+        self.total_value += values[index]
+
+    def reset(self, rng=None):
+        """Remet à zéro la fourmi pour une nouvelle construction
+        solution est remplacée (la liste rendue par construct_solution reste valide), indices vidée sur place"""
+        if rng is not None:
+            self.rng = rng
         self.solution = []
+        self.indices.clear()
         self.total_weight = 0
-        self.total_value = 0
\ No newline at end of file
+        self.total_value = 0
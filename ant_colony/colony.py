@@ -1,76 +1,296 @@
 # ant_colony/colony.py
+import logging
+import random
+import time
+import numpy as np
 from .ant import Ant
+from .metrics import ColonyMetrics
+from .parallel import AntPool, construct_ants
 from .pheromone import initialize_pheromones, update_pheromones, get_pheromone_stats
+from .tables import SelectionTable
+
+logger = logging.getLogger(__name__)
+
+# Moteurs de construction disponibles
+ENGINES = ('python', 'numpy')
+
+# Raisons d'arrêt enregistrées dans stop_reason
+STOP_ITERATIONS = 'iterations'    # Nombre d'itérations atteint
+STOP_PATIENCE = 'patience'        # Pas d'amélioration suffisante depuis patience itérations
+STOP_TIME_LIMIT = 'time_limit'    # Budget de temps écoulé
+STOP_TARGET = 'target_value'      # Valeur cible atteinte
+STOP_OPTIMAL = 'optimal'          # Borne supérieure atteinte : optimalité prouvée
+STOP_INTERRUPTED = 'interrupted'  # Boucle de iterate() interrompue par l'appelant
 
 class Colony:
-    def __init__(self, problem, alpha=1, beta=2, evaporation=0.5, num_ants=30, iterations=100):
+    def __init__(self, problem, alpha=1, beta=2, evaporation=0.5, num_ants=30, iterations=100,
+                 engine='python', seed=None, workers=1, patience=None, time_limit=None,
+                 target_value=None, min_improvement=0.0, use_upper_bound=True,
+                 log_level=logging.INFO, log_every=20, log_interval=0.0, instrument=False,
+                 candidate_size=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur inconnu: {engine} (disponibles: {', '.join(ENGINES)})")
+        if workers > 1 and engine != 'python':
+            raise ValueError("La construction parallèle (workers > 1) requiert le moteur 'python'")
+        if candidate_size is not None and engine != 'python':
+            raise ValueError("La liste de candidats (candidate_size) requiert le moteur 'python'")
+
         self.problem = problem
         self.alpha = alpha
         self.beta = beta
         self.evaporation = evaporation
         self.num_ants = num_ants
         self.iterations = iterations
-        self.pheromones = initialize_pheromones(problem.items)
+        self.engine = engine
+        self.seed = seed
+        self.workers = workers
+        # Liste de candidats : chaque fourmi tire parmi les candidate_size objets les plus attractifs
+        # de l'itération, puis parmi tous les objets faisables une fois la liste épuisée (None: désactivée)
+        self.candidate_size = candidate_size
+        # Critères d'arrêt anticipé (None: désactivé)
+        self.patience = patience                  # Itérations sans amélioration tolérées
+        self.time_limit = time_limit              # Secondes
+        self.target_value = target_value
+        self.min_improvement = min_improvement    # Amélioration relative minimale remettant patience à zéro
+        self.stop_reason = None
+        # Journalisation (logger 'ant_colony.colony', niveau log_level) : une ligne toutes les
+        # log_every itérations, au plus une par log_interval secondes
+        self.log_level = log_level
+        self.log_every = log_every
+        self.log_interval = log_interval
+        # Borne supérieure (relaxation de Dantzig) calculée une fois : arrêt dès qu'elle est atteinte
+        self.upper_bound = None
+        if use_upper_bound:
+            # Mise en cache par le problème : recalculée seulement si la capacité change
+            self.upper_bound = problem.get_upper_bound()
+        # Graine de base dont dérive la graine de chaque fourmi (résultats identiques quel que soit workers)
+        self.base_seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.pool = None
+        self.pheromones = initialize_pheromones(problem.table)
+        self.table = SelectionTable(problem.table, alpha, beta, candidate_size)
+        self.ant = None  # Fourmi réutilisée par toutes les constructions du moteur 'python' (sans pool)
+        self.vectorized_engine = None
+        if engine == 'numpy':
+            from .vectorized import VectorizedEngine
+            self.vectorized_engine = VectorizedEngine(problem.table, problem.capacity, seed=seed)
+        # Temps par phase et compteurs (None: instrumentation désactivée)
+        self.metrics = ColonyMetrics() if instrument else None
         self.best_solution = None
+        self.best_positions = None
         self.best_value = 0
         self.history = []
         self.iteration_stats = []
+        # Trace des améliorations de la dernière exécution : (secondes depuis son début, itération, fourmi,
+        # valeur). Granularité de l'itération : chaque point est horodaté à l'évaluation de l'itération,
+        # pas à la fin de la construction de la fourmi
+        self.improvement_trace = []
+        self.start_time = None
 
     def run(self):
         """Exécute l'algorithme de colonie de fourmis"""
-        print(f"Démarrage de l'algorithme ACO...")
-        print(f"Paramètres: α={self.alpha}, β={self.beta}, évaporation={self.evaporation}")
-        print(f"Nombre de fourmis: {self.num_ants}, Itérations: {self.iterations}")
-        print(f"Capacité du sac: {self.problem.capacity}")
-        print("-" * 60)
-
-        for iteration in range(self.iterations):
-            all_solutions = []
-            iteration_best_value = 0
-
-            # Chaque fourmi construit une solution
-            for _ in range(self.num_ants):
-                ant = Ant(self.problem.items, self.problem.capacity, 
-                         self.pheromones, self.alpha, self.beta)
-                solution, value = ant.construct_solution()
-                all_solutions.append((solution, value))
-
-                # Mise à jour de la meilleure solution de l'itération
-                if value > iteration_best_value:
-                    iteration_best_value = value
-
-                # Mise à jour de la meilleure solution globale
-                if value > self.best_value:
-                    self.best_solution = solution
-                    self.best_value = value
-
-            # Mise à jour des phéromones
-            update_pheromones(self.pheromones, all_solutions, self.evaporation,
-                            self.best_solution, self.best_value)
-
-            # Enregistrement de l'historique
-            self.history.append(self.best_value)
-            
-            # Statistiques de l'itération
-            avg_value = sum(value for _, value in all_solutions) / len(all_solutions)
-            self.iteration_stats.append({
-                'iteration': iteration + 1,
-                'best_value': self.best_value,
-                'iteration_best': iteration_best_value,
-                'average_value': avg_value
-            })
-
-            # Affichage périodique des résultats
-            if (iteration + 1) % 20 == 0 or iteration == 0:
-                pheromone_stats = get_pheromone_stats(self.pheromones)
-                print(f"Itération {iteration + 1:3d}: "
-                      f"Meilleure={self.best_value:6.1f}, "
-                      f"Moyenne={avg_value:6.1f}, "
-                      f"Phéromones(min={pheromone_stats['min']:.2f}, "
-                      f"max={pheromone_stats['max']:.2f})")
-
+        for _ in self.iterate():
+            pass
         return self.best_solution, self.best_value, self.history
 
+    def iterate(self):
+        """Exécute l'algorithme itération par itération et produit les statistiques de chacune
+        L'appelant peut interrompre la boucle (stop_reason = 'interrupted') ou modifier les
+        paramètres (alpha, beta, évaporation, fourmis) entre deux itérations
+        improvement_trace est remis à zéro avec start_time : ses temps sont ceux de cette exécution,
+        à la granularité de l'itération"""
+        self._log_banner()
+        start_time = self.start_time = time.perf_counter()
+        self.improvement_trace = []
+        last_log_time = None
+        self.stop_reason = None
+        reference_value = self.best_value  # Dernière valeur ayant remis la patience à zéro
+        stale_iterations = 0
+        try:
+            for iteration in range(self.iterations):
+                stats = self._run_iteration(iteration)
+                stats['elapsed'] = time.perf_counter() - start_time
+
+                # Affichage périodique des résultats, limité à un message par log_interval secondes
+                if ((iteration + 1) % self.log_every == 0 or iteration == 0) and logger.isEnabledFor(self.log_level):
+                    now = time.perf_counter()
+                    if last_log_time is None or now - last_log_time >= self.log_interval:
+                        last_log_time = now
+                        pheromone_stats = get_pheromone_stats(self.pheromones)
+                        logger.log(self.log_level,
+                                   f"Itération {iteration + 1:3d}: "
+                                   f"Meilleure={self.best_value:6.1f}, "
+                                   f"Moyenne={stats['average_value']:6.1f}, "
+                                   f"Phéromones(min={pheromone_stats['min']:.2f}, "
+                                   f"max={pheromone_stats['max']:.2f})")
+
+                yield stats
+
+                # Amélioration significative : relative à la dernière valeur retenue
+                threshold = reference_value + abs(reference_value) * self.min_improvement
+                if self.best_value > threshold:
+                    reference_value = self.best_value
+                    stale_iterations = 0
+                else:
+                    stale_iterations += 1
+
+                reason = self._should_stop(start_time, stale_iterations)
+                if reason is not None:
+                    self.stop_reason = reason
+                    logger.log(self.log_level, f"Arrêt anticipé à l'itération {iteration + 1} ({reason})")
+                    return
+            self.stop_reason = STOP_ITERATIONS
+        finally:
+            if self.stop_reason is None:
+                self.stop_reason = STOP_INTERRUPTED
+            if self.pool is not None:
+                self.pool.close()
+                self.pool = None
+
+    def _log_banner(self):
+        if not logger.isEnabledFor(self.log_level):
+            return
+        logger.log(self.log_level, "Démarrage de l'algorithme ACO...")
+        logger.log(self.log_level, f"Paramètres: α={self.alpha}, β={self.beta}, évaporation={self.evaporation}")
+        logger.log(self.log_level, f"Nombre de fourmis: {self.num_ants}, Itérations: {self.iterations}, Moteur: {self.engine}")
+        logger.log(self.log_level, f"Capacité du sac: {self.problem.capacity}")
+        if self.upper_bound is not None:
+            logger.log(self.log_level, f"Borne supérieure (Dantzig): {self.upper_bound:.2f}")
+        if self.workers > 1:
+            logger.log(self.log_level, f"Construction parallèle: {self.workers} processus")
+        if self.table.candidate_size is not None:
+            logger.log(self.log_level, f"Liste de candidats: {self.table.candidate_size} objets")
+        logger.log(self.log_level, "-" * 60)
+
+    def bound_gap(self):
+        """Écart relatif (en %) entre la meilleure valeur et la borne supérieure, None sans borne"""
+        if self.upper_bound is None:
+            return None
+        if self.upper_bound <= 0:
+            return 0.0
+        return max(0.0, (self.upper_bound - self.best_value) / self.upper_bound * 100)
+
+    def _should_stop(self, start_time, stale_iterations):
+        """Retourne la raison d'arrêt anticipé, ou None pour continuer"""
+        if self.upper_bound is not None and self.best_value >= self.upper_bound - 1e-9 * max(1, abs(self.upper_bound)):
+            return STOP_OPTIMAL
+        if self.target_value is not None and self.best_value >= self.target_value:
+            return STOP_TARGET
+        if self.patience is not None and stale_iterations >= self.patience:
+            return STOP_PATIENCE
+        if self.time_limit is not None and time.perf_counter() - start_time >= self.time_limit:
+            return STOP_TIME_LIMIT
+        return None
+
+    def _sync_parameters(self):
+        """Prend en compte alpha/beta modifiés entre deux itérations"""
+        if self.table.alpha == self.alpha and self.table.beta == self.beta:
+            return
+        self.table = SelectionTable(self.problem.table, self.alpha, self.beta, self.candidate_size)
+        if self.pool is not None:
+            # Les processus ont été initialisés avec les anciens paramètres
+            self.pool.close()
+            self.pool = None
+
+    def _run_iteration(self, iteration):
+        """Construit les solutions d'une itération, met à jour les phéromones et retourne ses statistiques"""
+        self._sync_parameters()
+        metrics = self.metrics
+        if metrics is not None:
+            snapshot = metrics.snapshot()
+            phase_start = time.perf_counter()
+
+        # Solutions sous forme de positions : les vues Item ne sont créées que pour la meilleure
+        all_solutions = self._construct_solutions(iteration)
+        if metrics is not None:
+            now = time.perf_counter()
+            metrics.add_time('construction', now - phase_start)
+            phase_start = now
+        iteration_best_value = 0
+        improved = False
+
+        for ant_index, (positions, value) in enumerate(all_solutions):
+            # Mise à jour de la meilleure solution de l'itération
+            if value > iteration_best_value:
+                iteration_best_value = value
+
+            # Mise à jour de la meilleure solution globale (horodatée à l'évaluation de l'itération)
+            if value > self.best_value:
+                self.best_positions = positions
+                self.best_value = value
+                improved = True
+                self.improvement_trace.append((time.perf_counter() - self.start_time, iteration + 1,
+                                               ant_index, value))
+
+        if improved:
+            self.best_solution = self.problem.item_views(self.best_positions)
+
+        # Mise à jour des phéromones
+        if metrics is not None:
+            now = time.perf_counter()
+            metrics.add_time('bookkeeping', now - phase_start)
+            phase_start = now
+        deposits = update_pheromones(self.pheromones, all_solutions, self.evaporation,
+                                     self.best_positions, self.best_value)
+        if metrics is not None:
+            now = time.perf_counter()
+            metrics.add_time('pheromone_update', now - phase_start)
+            metrics.count('pheromone_deposits', deposits)
+            phase_start = now
+
+        # Enregistrement de l'historique
+        self.history.append(self.best_value)
+
+        # Statistiques de l'itération
+        avg_value = sum(value for _, value in all_solutions) / len(all_solutions)
+        stats = {
+            'iteration': iteration + 1,
+            'best_value': self.best_value,
+            'iteration_best': iteration_best_value,
+            'average_value': avg_value,
+            'improved': improved,
+            'upper_bound': self.upper_bound,
+            'gap': self.bound_gap()
+        }
+        if metrics is not None:
+            metrics.iterations += 1
+            metrics.add_time('bookkeeping', time.perf_counter() - phase_start)
+            stats['metrics'] = metrics.delta(snapshot)
+        self.iteration_stats.append(stats)
+        return stats
+
+    def _construct_solutions(self, iteration):
+        """Construit les solutions de toutes les fourmis de l'itération"""
+        if self.workers > 1:
+            # Les mises à jour de phéromones restent dans le processus parent
+            if self.pool is None:
+                self.pool = AntPool(self.problem.table, self.problem.capacity,
+                                    self.alpha, self.beta, self.workers, self.candidate_size)
+            results = self.pool.construct(self.pheromones, self.base_seed, iteration, self.num_ants)
+            if self.metrics is not None:
+                # Les compteurs fins restent dans les processus : seules les étapes sont connues ici
+                self.metrics.count('ants', len(results))
+                self.metrics.count('construction_steps', sum(len(indices) for indices, _ in results))
+        else:
+            self.table.refresh(self.pheromones)
+            if self.vectorized_engine is not None:
+                selections, total_values = self.vectorized_engine.construct(self.table.attractiveness,
+                                                                            self.num_ants, self.metrics)
+                return list(zip(selections, total_values.tolist()))
+            if self.ant is None:
+                self.ant = Ant(self.problem.table, self.problem.capacity, None, self.alpha, self.beta,
+                               rng=random.Random())
+            # Positions uniquement : la table ne crée des vues Item que pour la meilleure solution
+            results = construct_ants(self.problem.table, self.problem.capacity, self.table,
+                                     self.base_seed, iteration, range(self.num_ants), self.metrics, self.ant)
+
+        return [(np.asarray(indices, dtype=np.intp), value) for indices, value in results]
+
+    def get_metrics(self):
+        """Retourne les temps par phase, compteurs et débits cumulés (None si non instrumentée)"""
+        if self.metrics is None:
+            return None
+        return self.metrics.as_dict()
+
     def get_convergence_info(self):
         """Retourne des informations sur la convergence de l'algorithme"""
         if not self.history:
@@ -86,5 +306,7 @@ class Colony:
             'final_value': self.history[-1],
             'improvements_count': len(improvements),
             'improvement_iterations': improvements,
-            'convergence_iteration': improvements[-1] if improvements else 0
+            'convergence_iteration': improvements[-1] if improvements else 0,
+            'stop_reason': self.stop_reason,
+            'improvement_trace': list(self.improvement_trace)
         }
\ No newline at end of file
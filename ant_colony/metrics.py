@@ -0,0 +1,60 @@
+# ant_colony/metrics.py
+"""
+Instrumentation de la colonie : temps cumulés par phase et compteurs
+Désactivée par défaut (metrics = None) : le code instrumenté ne teste alors qu'une
+référence par itération ou par fourmi, sans appel d'horloge.
+"""
+
+import time
+
+# Phases chronométrées (secondes cumulées)
+PHASES = ('construction', 'sampling', 'pheromone_update', 'bookkeeping')
+# Compteurs cumulés
+COUNTERS = ('ants', 'construction_steps', 'sampling_calls', 'feasibility_checks', 'pheromone_deposits')
+
+class ColonyMetrics:
+    def __init__(self):
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.iterations = 0
+        self.started = time.perf_counter()
+
+    def add_time(self, phase, seconds):
+        self.timings[phase] += seconds
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+
+    def snapshot(self):
+        """Copie des temps et compteurs courants (pour calculer l'écart d'une itération)"""
+        return dict(self.timings), dict(self.counters)
+
+    def delta(self, snapshot):
+        """Temps, compteurs et débits depuis snapshot"""
+        timings, counters = snapshot
+        delta = {
+            'timings': {phase: self.timings[phase] - timings[phase] for phase in PHASES},
+            'counters': {name: self.counters[name] - counters[name] for name in COUNTERS}
+        }
+        delta['throughput'] = throughput(delta['timings'], delta['counters'])
+        return delta
+
+    def as_dict(self):
+        """Temps, compteurs et débits cumulés depuis le début de l'exécution"""
+        return {
+            'iterations': self.iterations,
+            'elapsed': time.perf_counter() - self.started,
+            'timings': dict(self.timings),
+            'counters': dict(self.counters),
+            'throughput': throughput(self.timings, self.counters)
+        }
+
+def throughput(timings, counters):
+    """Fourmis et étapes de construction par seconde de construction"""
+    seconds = timings['construction']
+    if seconds <= 0:
+        return {'ants_per_second': 0.0, 'steps_per_second': 0.0}
+    return {
+        'ants_per_second': counters['ants'] / seconds,
+        'steps_per_second': counters['construction_steps'] / seconds
+    }
@@ -0,0 +1,87 @@
+# ant_colony/parallel.py
+"""
+Construction parallèle des fourmis dans un pool de processus
+Les données du problème sont envoyées une seule fois à chaque processus et le
+snapshot des phéromones de l'itération est partagé via une mémoire partagée
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+
+import numpy as np
+
+from .ant import Ant
+from .tables import SelectionTable
+
+def ant_seed(base_seed, iteration, ant_index):
+    """Graine propre à une fourmi, indépendante du processus qui la construit"""
+    state = np.random.SeedSequence([base_seed, iteration, ant_index]).generate_state(1, dtype=np.uint64)
+    return int(state[0])
+
+def construct_ants(items, capacity, table, base_seed, iteration, ant_indices, metrics=None, ant=None):
+    """Construit les fourmis demandées; retourne [(positions, valeur)] dans l'ordre des fourmis
+    ant: fourmi réutilisée (roulettes et listes de travail remises à zéro sur place entre deux fourmis)"""
+    if ant is None:
+        ant = Ant(items, capacity, None, table.alpha, table.beta, rng=random.Random(), metrics=metrics)
+    ant.table = table
+    ant.alpha, ant.beta = table.alpha, table.beta
+    ant.metrics = metrics
+    results = []
+    for ant_index in ant_indices:
+        ant.rng.seed(ant_seed(base_seed, iteration, ant_index))
+        ant.construct()
+        results.append((np.array(ant.indices, dtype=np.intp), ant.total_value))
+    return results
+
+# État propre à chaque processus du pool (initialisé une seule fois)
+_worker = {}
+
+def _init_worker(items, capacity, alpha, beta, shm_name, candidate_size=None):
+    # Le processus parent reste seul responsable de la libération du segment
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker['shm'] = shm
+    _worker['items'] = items
+    _worker['capacity'] = capacity
+    _worker['table'] = SelectionTable(items, alpha, beta, candidate_size)
+    _worker['ant'] = Ant(items, capacity, None, alpha, beta, rng=random.Random())
+    _worker['pheromones'] = SimpleNamespace(levels=np.ndarray((len(items),), dtype=float, buffer=shm.buf))
+    _worker['iteration'] = None
+
+def _construct_chunk(base_seed, iteration, ant_indices):
+    table = _worker['table']
+    if _worker['iteration'] != iteration:
+        table.refresh(_worker['pheromones'])
+        _worker['iteration'] = iteration
+    return construct_ants(_worker['items'], _worker['capacity'], table,
+                          base_seed, iteration, ant_indices, ant=_worker['ant'])
+
+class AntPool:
+    """Pool de processus construisant les fourmis d'une itération"""
+
+    def __init__(self, items, capacity, alpha, beta, workers, candidate_size=None):
+        self.workers = workers
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, len(items)) * 8)
+        self.levels = np.ndarray((len(items),), dtype=float, buffer=self.shm.buf)
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                            initargs=(items, capacity, alpha, beta, self.shm.name,
+                                                      candidate_size))
+
+    def construct(self, pheromones, base_seed, iteration, num_ants):
+        """Répartit les fourmis en blocs contigus; les résultats restent dans l'ordre des fourmis"""
+        self.levels[:] = pheromones.levels
+        chunk_size = -(-num_ants // self.workers)
+        futures = [self.executor.submit(_construct_chunk, base_seed, iteration,
+                                        range(start, min(start + chunk_size, num_ants)))
+                   for start in range(0, num_ants, chunk_size)]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def close(self):
+        self.executor.shutdown()
+        del self.levels
+        self.shm.close()
+        self.shm.unlink()
@@ -1,37 +1,142 @@
 # ant_colony/pheromone.py
+"""
+Stockage des phéromones avec évaporation paresseuse
+Le niveau effectif d'un objet vaut max(r·S, plancher) : r est la valeur brute stockée et
+S un facteur d'échelle global. Comme max(max(τ·ρ, f)·ρ, f) = max(τ·ρ², f), évaporer avec
+plancher revient à multiplier S par ρ = 1 - évaporation, sans toucher aux n objets; un dépôt
+n'écrit que les objets concernés. Lorsque S devient trop petit, r est renormalisé (S = 1).
+"""
+
+import numpy as np
+from knapsack.table import ItemTable
+
+MIN_PHEROMONE = 0.01  # Plancher appliqué après l'évaporation
+RENORMALIZE_SCALE = 1e-100  # Facteur d'échelle en dessous duquel r est renormalisé (évite le dépassement)
+DENSE_DEPOSIT_RATIO = 8  # Au-delà de n / 8 dépôts, le cumul par bincount sur n bat le tri de np.unique
+
+class PheromoneStore:
+    """Niveaux de phéromones indexés par position d'objet, évaporés par un facteur d'échelle global"""
+
+    def __init__(self, items, initial_value=1.0, floor=MIN_PHEROMONE):
+        self.raw = np.full(len(items), initial_value, dtype=float)
+        self.scale = 1.0
+        self.floor = floor
+        self.items = items
+        self._levels = np.empty_like(self.raw)
+        self._dirty = True
+        self._positions = None
+
+    @property
+    def levels(self):
+        """Niveaux effectifs (lecture seule), recalculés dans le même tampon après une mise à jour"""
+        if self._dirty:
+            np.multiply(self.raw, self.scale, out=self._levels)
+            np.maximum(self._levels, self.floor, out=self._levels)
+            self._dirty = False
+        return self._levels
+
+    def evaporate(self, rate):
+        """Évaporation avec plancher en O(1) (hors renormalisation occasionnelle)"""
+        self.scale *= (1 - rate)
+        if self.scale <= 0:
+            # Évaporation totale : tous les niveaux tombent au plancher
+            self.raw.fill(self.floor)
+            self.scale = 1.0
+        elif self.scale < RENORMALIZE_SCALE:
+            self.renormalize()
+        self._dirty = True
+
+    def renormalize(self):
+        """Ramène le facteur d'échelle à 1 sans changer les niveaux effectifs"""
+        np.multiply(self.raw, self.scale, out=self.raw)
+        np.maximum(self.raw, self.floor, out=self.raw)
+        self.scale = 1.0
+        self._dirty = True
+
+    def deposit(self, positions, amounts):
+        """Ajoute amounts aux niveaux effectifs des positions (répétitions cumulées); n'écrit que ces objets"""
+        if len(positions) * DENSE_DEPOSIT_RATIO >= len(self.raw):
+            totals = np.bincount(positions, weights=amounts, minlength=len(self.raw))
+            touched = np.flatnonzero(totals)
+            totals = totals[touched]
+        else:
+            touched, inverse = np.unique(positions, return_inverse=True)
+            totals = np.bincount(inverse, weights=amounts, minlength=len(touched))
+        current = np.maximum(self.raw[touched] * self.scale, self.floor)
+        self.raw[touched] = (current + totals) / self.scale
+        self._dirty = True
+
+    @property
+    def positions(self):
+        """Correspondance id -> position, construite seulement pour les accès par identifiant"""
+        if self._positions is None:
+            items = self.items
+            ids = items.ids.tolist() if isinstance(items, ItemTable) else [item.id for item in items]
+            self._positions = {item_id: position for position, item_id in enumerate(ids)}
+        return self._positions
+
+    def __getitem__(self, item_id):
+        return max(float(self.raw[self.positions[item_id]]) * self.scale, self.floor)
+
+    def __setitem__(self, item_id, value):
+        self.raw[self.positions[item_id]] = value / self.scale
+        self._dirty = True
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __iter__(self):
+        return iter(self.positions)
+
+    def values(self):
+        return self.levels
+
+    def indices(self, solution):
+        """Convertit une solution (objets ou positions) en tableau de positions"""
+        if isinstance(solution, np.ndarray):
+            return solution.astype(np.intp, copy=False)
+        if solution and not hasattr(solution[0], 'id'):
+            return np.asarray(solution, dtype=np.intp)
+        positions = self.positions
+        return np.fromiter((positions[item.id] for item in solution), dtype=np.intp, count=len(solution))
 
 def initialize_pheromones(items, initial_value=1.0):
     """Initialise les niveaux de phéromones pour tous les objets"""
-    return {item.id: initial_value for item in items}
+    return PheromoneStore(items, initial_value)
 
 def update_pheromones(pheromones, all_solutions, evaporation_rate, best_solution, best_value):
-    """Met à jour les niveaux de phéromones après une itération"""
-    
-    # Phase d'évaporation
-    for item_id in pheromones:
-        pheromones[item_id] *= (1 - evaporation_rate)
-        # Éviter que les phéromones deviennent trop faibles
-        if pheromones[item_id] < 0.01:
-            pheromones[item_id] = 0.01
-    
+    """Met à jour les niveaux de phéromones après une itération; retourne le nombre de dépôts"""
+    # Phase d'évaporation (facteur d'échelle global) avec plancher pour éviter des phéromones trop faibles
+    pheromones.evaporate(evaporation_rate)
+
     # Renforcement basé sur la qualité des solutions
+    indices = []
+    deposits = []
     for solution, value in all_solutions:
-        if value > 0:  # Solution valide
+        if value > 0 and len(solution):  # Solution valide
             pheromone_deposit = value / best_value if best_value > 0 else 0
-            for item in solution:
-                pheromones[item.id] += pheromone_deposit
-    
+            positions = pheromones.indices(solution)
+            indices.append(positions)
+            deposits.append(np.full(len(positions), pheromone_deposit))
+
     # Renforcement élitiste pour la meilleure solution
-    if best_solution and best_value > 0:
-        elite_deposit = best_value * 0.1
-        for item in best_solution:
-            pheromones[item.id] += elite_deposit
+    if best_solution is not None and len(best_solution) and best_value > 0:
+        positions = pheromones.indices(best_solution)
+        indices.append(positions)
+        deposits.append(np.full(len(positions), best_value * 0.1))
+
+    # Dépôt cumulé de toutes les solutions en une seule passe, limité aux objets déposés
+    if not indices:
+        return 0
+    positions = np.concatenate(indices)
+    pheromones.deposit(positions, np.concatenate(deposits))
+    return len(positions)
 
 def get_pheromone_stats(pheromones):
     """Retourne des statistiques sur les niveaux de phéromones"""
-    values = list(pheromones.values())
+    levels = pheromones.levels
     return {
-        'min': min(values),
-        'max': max(values),
-        'avg': sum(values) / len(values)
-    }
\ No newline at end of file
+        'min': float(levels.min()),
+        'max': float(levels.max()),
+        'avg': float(levels.mean())
+    }
@@ -0,0 +1,116 @@
+# ant_colony/sampling.py
+"""
+Roulette pondérée avec suppression en O(log n) (arbre de Fenwick)
+Le tirage reste proportionnel aux poids des objets encore présents
+"""
+
+import numpy as np
+
+def fenwick_array(weights):
+    """Arbre de Fenwick (indexé à partir de 1) d'un tableau de poids, sous forme de tableau NumPy"""
+    weights = np.asarray(weights, dtype=float)
+    n = len(weights)
+    cumulative = np.zeros(n + 1)
+    np.cumsum(weights, out=cumulative[1:])
+    index = np.arange(1, n + 1)
+    tree = np.zeros(n + 1)
+    tree[1:] = cumulative[index] - cumulative[index - (index & -index)]
+    return tree
+
+def build_fenwick(weights):
+    """Construit l'arbre de Fenwick (indexé à partir de 1) d'un tableau de poids"""
+    return fenwick_array(weights).tolist()
+
+class FenwickSampler:
+    def __init__(self, weights):
+        self.reset(weights)
+
+    def reset(self, weights):
+        """Réinitialise l'échantillonneur avec de nouveaux poids"""
+        weights = np.asarray(weights, dtype=float)
+        self.weights = weights.tolist()
+        self.tree = build_fenwick(weights)
+        self.n = len(weights)
+        self.total = float(weights.sum())
+        self.count = int(np.count_nonzero(weights > 0))
+        self.top = 1 << (self.n.bit_length() - 1) if self.n else 0
+
+    def copy(self, out=None):
+        """Copie indépendante (O(n) en mémoire contiguë, sans recalcul de l'arbre)
+        out: roulette de même taille dont les listes sont réécrites sur place (aucune allocation)"""
+        if out is not None and out.n == self.n:
+            out.weights[:] = self.weights
+            out.tree[:] = self.tree
+            out.total = self.total
+            out.count = self.count
+            out.top = self.top
+            return out
+        clone = FenwickSampler.__new__(FenwickSampler)
+        clone.weights = self.weights.copy()
+        clone.tree = self.tree.copy()
+        clone.n = self.n
+        clone.total = self.total
+        clone.count = self.count
+        clone.top = self.top
+        return clone
+
+    def remove(self, index):
+        """Retire l'objet à la position index (son poids devient nul)"""
+        weight = self.weights[index]
+        if weight <= 0:
+            return
+        self.weights[index] = 0.0
+        self.total -= weight
+        self.count -= 1
+        tree = self.tree
+        i = index + 1
+        while i <= self.n:
+            tree[i] -= weight
+            i += i & -i
+
+    def draw(self, rng):
+        """Tire une position proportionnellement aux poids restants (None si tous nuls)"""
+        if self.count == 0:
+            return None
+        index = self._descend(rng.random() * self.total)
+        if index >= self.n or self.weights[index] <= 0:
+            # Dérive d'arrondi accumulée par les suppressions : reconstruction de l'arbre
+            self.reset(self.weights)
+            index = self._descend(rng.random() * self.total)
+            if index >= self.n or self.weights[index] <= 0:
+                index = next(i for i, weight in enumerate(self.weights) if weight > 0)
+        return index
+
+    def prefix(self, count):
+        """Somme des poids des count premières positions"""
+        tree = self.tree
+        total = 0.0
+        i = count
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def draw_prefix(self, rng, count):
+        """Tire une position parmi les count premières proportionnellement aux poids (None si tous nuls)"""
+        total = self.prefix(count)
+        if total <= 0:
+            return None
+        index = self._descend(rng.random() * total)
+        if index >= count or self.weights[index] <= 0:
+            # Dérive d'arrondi : premier objet de poids non nul du préfixe
+            index = next((i for i in range(count) if self.weights[i] > 0), None)
+        return index
+
+    def _descend(self, target):
+        """Plus grande position dont la somme préfixe est <= target"""
+        tree = self.tree
+        position = 0
+        step = self.top
+        while step:
+            following = position + step
+            if following <= self.n and tree[following] <= target:
+                position = following
+                target -= tree[following]
+            step >>= 1
+        return position
@@ -0,0 +1,165 @@
+# ant_colony/tables.py
+"""
+Tables de sélection partagées (lecture seule) par toutes les fourmis
+η^β est calculé une fois par problème, τ^α·η^β une fois par itération.
+Les structures Python (listes, dictionnaires, roulette) ne sont construites qu'à la
+première utilisation par le moteur 'python' : le moteur vectorisé n'utilise que les tableaux.
+Avec candidate_size = k, la liste des k objets les plus attractifs (np.argpartition, O(n))
+et sa roulette sont construites une fois par itération : les fourmis y tirent en O(k), puis,
+la liste épuisée, dans une roulette des objets triés par poids croissant.
+"""
+
+import numpy as np
+from knapsack.table import ItemTable
+from .sampling import FenwickSampler
+
+REFRESH_CHUNK_SIZE = 1 << 16  # Taille des blocs du recalcul de τ^α·η^β (évite un temporaire de taille n)
+
+class SelectionTable:
+    def __init__(self, items, alpha, beta, candidate_size=None):
+        if not isinstance(items, ItemTable):
+            items = ItemTable.from_items(items)
+        self.items = items
+        self.alpha = alpha
+        self.beta = beta
+        # Taille de la liste de candidats (None ou >= n : roulette sur tous les objets)
+        self.candidate_size = candidate_size if candidate_size and candidate_size < len(items) else None
+        self.heuristic_beta = items.ratios ** beta
+
+        # Attractivité τ^α·η^β par position
+        self.attractiveness = self.heuristic_beta.copy()
+        self._ids = None
+        self._by_id = None
+        self._sampler = None
+        self._item_weights = None
+        self._item_values = None
+        self._weight_order = None
+        self._candidate_positions = None
+        self._candidates = None
+        self._candidate_sampler = None
+        self._candidate_weight_order = None
+        self._ascending_order = None
+        self._ascending_positions = None
+        self._ascending_weights = None
+        self._ascending_rank = None
+        self._ascending_sampler = None
+
+    def refresh(self, pheromones):
+        """Recalcule τ^α·η^β à partir des phéromones de l'itération courante"""
+        levels = pheromones.levels
+        attractiveness = self.attractiveness
+        for start, stop in self.items.chunks(REFRESH_CHUNK_SIZE):
+            np.power(levels[start:stop], self.alpha, out=attractiveness[start:stop])
+            attractiveness[start:stop] *= self.heuristic_beta[start:stop]
+        self._by_id = None
+        self._sampler = None
+        self._candidate_positions = None
+        self._candidates = None
+        self._candidate_sampler = None
+        self._candidate_weight_order = None
+        self._ascending_sampler = None
+        return self
+
+    @property
+    def ids(self):
+        if self._ids is None:
+            self._ids = self.items.ids.tolist()
+        return self._ids
+
+    @property
+    def by_id(self):
+        """Attractivité par identifiant d'objet (Ant.select_item)"""
+        if self._by_id is None:
+            self._by_id = dict(zip(self.ids, self.attractiveness.tolist()))
+        return self._by_id
+
+    @property
+    def sampler(self):
+        """Roulette prototype : chaque fourmi en prend une copie au lieu de reconstruire l'arbre"""
+        if self._sampler is None:
+            self._sampler = FenwickSampler(self.attractiveness)
+        return self._sampler
+
+    @property
+    def item_weights(self):
+        if self._item_weights is None:
+            self._item_weights = self.items.weights.tolist()
+        return self._item_weights
+
+    @property
+    def item_values(self):
+        if self._item_values is None:
+            self._item_values = self.items.values.tolist()
+        return self._item_values
+
+    @property
+    def weight_order(self):
+        """Positions triées par poids décroissant : seuil glissant de faisabilité des fourmis"""
+        if self._weight_order is None:
+            self._weight_order = np.argsort(-self.items.weights, kind='stable').tolist()
+        return self._weight_order
+
+    @property
+    def candidate_positions(self):
+        """Positions des candidate_size objets les plus attractifs (ordre quelconque), None sans liste"""
+        if self.candidate_size is None:
+            return None
+        if self._candidate_positions is None:
+            k = self.candidate_size
+            self._candidate_positions = np.argpartition(self.attractiveness, len(self.attractiveness) - k)[-k:]
+        return self._candidate_positions
+
+    @property
+    def candidates(self):
+        """Liste de candidats de l'itération (positions), None sans liste"""
+        if self._candidates is None and self.candidate_size is not None:
+            self._candidates = self.candidate_positions.tolist()
+        return self._candidates
+
+    @property
+    def candidate_sampler(self):
+        """Roulette prototype restreinte aux candidats (indices locaux à candidates)"""
+        if self._candidate_sampler is None:
+            self._candidate_sampler = FenwickSampler(self.attractiveness[self.candidate_positions])
+        return self._candidate_sampler
+
+    @property
+    def candidate_weight_order(self):
+        """Indices locaux des candidats triés par poids décroissant"""
+        if self._candidate_weight_order is None:
+            weights = self.items.weights[self.candidate_positions]
+            self._candidate_weight_order = np.argsort(-weights, kind='stable').tolist()
+        return self._candidate_weight_order
+
+    @property
+    def ascending_order(self):
+        """Positions triées par poids croissant (liste) : les objets faisables en forment un préfixe"""
+        if self._ascending_order is None:
+            order = np.argsort(self.items.weights, kind='stable')
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            self._ascending_positions = order
+            self._ascending_weights = self.items.weights[order]
+            self._ascending_order = order.tolist()
+            self._ascending_rank = rank.tolist()
+        return self._ascending_order
+
+    @property
+    def ascending_weights(self):
+        """Poids triés par ordre croissant (tableau, pour np.searchsorted)"""
+        self.ascending_order
+        return self._ascending_weights
+
+    @property
+    def ascending_rank(self):
+        """Rang de chaque position dans ascending_order"""
+        self.ascending_order
+        return self._ascending_rank
+
+    @property
+    def ascending_sampler(self):
+        """Roulette prototype indexée par rang de poids croissant (repli de la liste de candidats)"""
+        if self._ascending_sampler is None:
+            self.ascending_order
+            self._ascending_sampler = FenwickSampler(self.attractiveness[self._ascending_positions])
+        return self._ascending_sampler
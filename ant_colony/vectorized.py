@@ -0,0 +1,264 @@
+# ant_colony/vectorized.py
+"""
+Moteur de construction vectorisé (NumPy)
+Toutes les fourmis d'une itération sont construites simultanément.
+Si fourmis × n tient dans DENSE_SELECTION_LIMIT, chaque fourmi a sa roulette de Fenwick
+sur les objets triés par poids croissant (les objets faisables forment un préfixe) :
+une étape coûte O(fourmis × log n) opérations vectorisées.
+Sinon les objets sont parcourus par blocs de chunk_size positions : la mémoire de travail
+est en O(fourmis × chunk_size) quel que soit le nombre d'objets (instances .kbin projetées),
+et les objets déjà choisis sont marqués dans un bitmap compact par bloc, mis à jour sur place.
+"""
+
+import time
+
+import numpy as np
+
+from .sampling import fenwick_array
+
+DEFAULT_CHUNK_SIZE = 1 << 16  # Positions traitées par bloc
+DENSE_SELECTION_LIMIT = 256 * 1024 ** 2  # Budget mémoire (octets) des roulettes par fourmi
+DENSE_CELL_BYTES = 17  # Par fourmi et par objet : masse et effectif (2 × float64) + marqueur de sélection
+
+class VectorizedEngine:
+    def __init__(self, table, capacity, seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.capacity = capacity
+        self.weights = table.weights
+        self.values = table.values
+        self.chunks = list(table.chunks(chunk_size))
+        self.rng = np.random.default_rng(seed)
+        self._ascending_order = None  # Positions triées par poids croissant (construction dense)
+        self._ascending_weights = None
+
+    def construct(self, attractiveness, num_ants, metrics=None):
+        """Construit les solutions de toutes les fourmis; retourne (positions par fourmi, valeurs)
+        metrics: ColonyMetrics optionnel (tirages et tests de faisabilité par fourmi active et par étape)"""
+        attractiveness = np.asarray(attractiveness, dtype=float)
+        if num_ants * (len(self.weights) + 1) * DENSE_CELL_BYTES <= DENSE_SELECTION_LIMIT:
+            ant_of, position_of, total_values, stats = self._construct_dense(attractiveness, num_ants)
+        else:
+            ant_of, position_of, total_values, stats = self._construct_chunked(attractiveness, num_ants)
+
+        # Regroupement des positions par fourmi, dans l'ordre de sélection
+        order = np.argsort(ant_of, kind='stable')
+        boundaries = np.searchsorted(ant_of[order], np.arange(num_ants + 1))
+        selections = [position_of[order[boundaries[a]:boundaries[a + 1]]] for a in range(num_ants)]
+        if metrics is not None:
+            sampling_time, sampling_calls, checks = stats
+            metrics.add_time('sampling', sampling_time)
+            metrics.count('ants', num_ants)
+            metrics.count('construction_steps', len(position_of))
+            metrics.count('sampling_calls', sampling_calls)
+            metrics.count('feasibility_checks', checks)
+        return selections, total_values
+
+    def _construct_dense(self, attractiveness, num_ants):
+        """Construction par roulettes de Fenwick (une par fourmi, mises à jour ensemble)
+        Retourne (fourmi, position) de chaque sélection, les valeurs et (temps, tirages, tests)"""
+        if self._ascending_order is None:
+            self._ascending_order = np.argsort(self.weights, kind='stable')
+            self._ascending_weights = np.asarray(self.weights)[self._ascending_order]
+        order = self._ascending_order
+        ascending_weights = self._ascending_weights
+        n = len(order)
+        top = 1 << (n.bit_length() - 1) if n else 0
+
+        # trees[fourmi, i] : (masse d'attractivité, nombre d'objets non choisis) du nœud i
+        masses = attractiveness[order]
+        base = np.stack((fenwick_array(masses), fenwick_array(np.ones(n))), axis=1)
+        trees = np.tile(base, (num_ants, 1, 1))
+        taken = np.zeros((num_ants, n), dtype=bool)
+
+        total_weights = np.zeros(num_ants)
+        total_values = np.zeros(num_ants)
+        step_ants = []
+        step_positions = []
+        sampling_time = 0.0
+        sampling_calls = 0
+        checks = 0
+
+        active = np.arange(num_ants)
+        while active.size:
+            # Objets qui tiennent encore : préfixe de l'ordre croissant des poids
+            counts = np.searchsorted(ascending_weights, self.capacity - total_weights[active], side='right')
+            # Arrondi : le test de faisabilité fait foi
+            while True:
+                over = counts > 0
+                over[over] = total_weights[active[over]] + ascending_weights[counts[over] - 1] > self.capacity
+                if not over.any():
+                    break
+                counts[over] -= 1
+            checks += active.size
+
+            sums = self._prefix(trees, active, counts)
+            has_feasible = sums[:, 1] > 0
+            if not has_feasible.all():
+                active, counts, sums = active[has_feasible], counts[has_feasible], sums[has_feasible]
+                if not active.size:
+                    break
+
+            sampling_started = time.perf_counter()
+            sampling_calls += active.size
+            totals = sums[:, 0]
+            draws = self.rng.random(active.size) * totals
+            draws = np.minimum(draws, np.nextafter(totals, 0))
+            local = self._descend(trees[..., 0], active, draws, top)
+
+            # Même règle que Ant.select_item : tirage uniforme si toutes les probabilités sont nulles
+            uniform = totals <= 0
+            if uniform.any():
+                ranks = np.floor(self.rng.random(uniform.sum()) * sums[uniform, 1])
+                local[uniform] = self._descend(trees[..., 1], active[uniform], ranks, top)
+
+            # Dérive d'arrondi accumulée par les suppressions : premier objet attractif non choisi
+            # du préfixe, ou tirage uniforme s'il n'en reste aucun
+            drifted = (local >= counts) | taken[active, np.minimum(local, n - 1)]
+            drifted[~uniform] |= masses[np.minimum(local[~uniform], n - 1)] <= 0
+            for row in np.flatnonzero(drifted):
+                free = np.flatnonzero(~taken[active[row], :counts[row]])
+                attractive = free[masses[free] > 0]
+                local[row] = attractive[0] if attractive.size else self.rng.choice(free)
+            sampling_time += time.perf_counter() - sampling_started
+
+            # Retrait de l'objet choisi de la roulette de chaque fourmi (fourmis distinctes)
+            taken[active, local] = True
+            removed = np.stack((masses[local], np.ones(active.size)), axis=1)
+            node = local + 1
+            rows = active
+            while node.size:
+                trees[rows, node] -= removed
+                node = node + (node & -node)
+                inside = node <= n
+                rows, node, removed = rows[inside], node[inside], removed[inside]
+
+            choices = order[local]
+            total_weights[active] += self.weights[choices]
+            total_values[active] += self.values[choices]
+            step_ants.append(active)
+            step_positions.append(choices)
+
+        ant_of = np.concatenate(step_ants) if step_ants else np.empty(0, dtype=np.intp)
+        position_of = np.concatenate(step_positions) if step_positions else np.empty(0, dtype=np.intp)
+        return ant_of, position_of, total_values, (sampling_time, sampling_calls, checks)
+
+    @staticmethod
+    def _prefix(trees, ants, counts):
+        """Sommes (masse, effectif) des counts premières positions de la roulette de chaque fourmi"""
+        sums = np.zeros((len(ants), trees.shape[2]))
+        rows = np.arange(len(ants))
+        node = counts.copy()
+        while True:
+            inside = node > 0
+            if not inside.any():
+                return sums
+            rows, node = rows[inside], node[inside]
+            sums[rows] += trees[ants[rows], node]
+            node = node - (node & -node)
+
+    @staticmethod
+    def _descend(tree, ants, targets, top):
+        """Plus grande position dont la somme préfixe est <= target, pour chaque fourmi"""
+        n = tree.shape[1] - 1
+        position = np.zeros(len(ants), dtype=np.intp)
+        targets = targets.copy()
+        step = top
+        while step:
+            following = position + step
+            values = tree[ants, np.minimum(following, n)]
+            move = (following <= n) & (values <= targets)
+            targets[move] -= values[move]
+            position[move] = following[move]
+            step >>= 1
+        return position
+
+    def _chunk_scores(self, attractiveness, chunk, ants, total_weights, taken):
+        """Scores et faisabilité des fourmis ants (une ligne par fourmi) sur un bloc de positions
+        taken: bitmap compact (uint8) des objets déjà choisis du bloc"""
+        start, stop = chunk
+        feasible = total_weights[ants, None] + self.weights[None, start:stop] <= self.capacity
+
+        # Les objets déjà choisis par une fourmi ne sont plus disponibles pour elle
+        feasible &= ~np.unpackbits(taken[ants], axis=1, count=stop - start).view(bool)
+
+        scores = np.where(feasible, attractiveness[start:stop], 0.0)
+        return scores, feasible
+
+    def _construct_chunked(self, attractiveness, num_ants):
+        """Construction par balayage des blocs (instances trop grandes pour les roulettes par fourmi)
+        Retourne (fourmi, position) de chaque sélection, les valeurs et (temps, tirages, tests)"""
+        total_weights = np.zeros(num_ants)
+        total_values = np.zeros(num_ants)
+        # Couples (fourmi, position) de chaque étape, regroupés par fourmi par construct
+        step_ants = []
+        step_positions = []
+        chunk_count = len(self.chunks)
+        taken = [np.zeros((num_ants, (stop - start + 7) // 8), dtype=np.uint8) for start, stop in self.chunks]
+
+        sampling_time = 0.0
+        sampling_calls = 0
+        checks = 0
+
+        active = np.arange(num_ants)
+        while active.size and chunk_count:
+            checks += active.size * len(self.weights)
+
+            # Passe 1 : masse d'attractivité et nombre d'objets faisables de chaque bloc
+            chunk_totals = np.zeros((active.size, chunk_count))
+            chunk_counts = np.zeros((active.size, chunk_count))
+            for c, chunk in enumerate(self.chunks):
+                scores, feasible = self._chunk_scores(attractiveness, chunk, active, total_weights, taken[c])
+                chunk_totals[:, c] = scores.sum(axis=1)
+                chunk_counts[:, c] = feasible.sum(axis=1)
+
+            has_feasible = chunk_counts.sum(axis=1) > 0
+            if not has_feasible.all():
+                active = active[has_feasible]
+                if not active.size:
+                    break
+                chunk_totals = chunk_totals[has_feasible]
+                chunk_counts = chunk_counts[has_feasible]
+                if chunk_count == 1:
+                    scores, feasible = scores[has_feasible], feasible[has_feasible]
+
+            # Même règle que Ant.select_item : tirage uniforme si toutes les probabilités sont nulles
+            uniform = chunk_totals.sum(axis=1) <= 0
+            if uniform.any():
+                chunk_totals[uniform] = chunk_counts[uniform]
+
+            # Roulette en deux temps : choix du bloc, puis de la position dans ce bloc
+            sampling_started = time.perf_counter()
+            sampling_calls += active.size
+            cumulative_chunks = np.cumsum(chunk_totals, axis=1)
+            totals = cumulative_chunks[:, -1]
+            draws = self.rng.random(active.size) * totals
+            draws = np.minimum(draws, np.nextafter(totals, 0))
+            chosen_chunks = (cumulative_chunks <= draws[:, None]).sum(axis=1)
+            rows = np.arange(active.size)
+            draws = np.maximum(draws - (cumulative_chunks[rows, chosen_chunks] - chunk_totals[rows, chosen_chunks]), 0)
+
+            choices = np.empty(active.size, dtype=np.intp)
+            for c in np.unique(chosen_chunks):
+                members = np.flatnonzero(chosen_chunks == c)
+                if chunk_count == 1:
+                    # Bloc unique : les scores de la passe 1 sont réutilisés
+                    block_scores, block_feasible = scores[members], feasible[members]
+                else:
+                    block_scores, block_feasible = self._chunk_scores(attractiveness, self.chunks[c], active[members],
+                                                                      total_weights, taken[c])
+                block_scores = np.where(uniform[members, None], block_feasible, block_scores)
+                cumulative = np.cumsum(block_scores, axis=1)
+                block_draws = np.minimum(draws[members], np.nextafter(cumulative[:, -1], 0))
+                local = (cumulative <= block_draws[:, None]).sum(axis=1)
+                choices[members] = self.chunks[c][0] + local
+                # Une sélection par fourmi et par étape : mise à jour du bitmap sans doublon
+                taken[c][active[members], local >> 3] |= (0x80 >> (local & 7)).astype(np.uint8)
+            sampling_time += time.perf_counter() - sampling_started
+
+            total_weights[active] += self.weights[choices]
+            total_values[active] += self.values[choices]
+            step_ants.append(active)
+            step_positions.append(choices)
+
+        ant_of = np.concatenate(step_ants) if step_ants else np.empty(0, dtype=np.intp)
+        position_of = np.concatenate(step_positions) if step_positions else np.empty(0, dtype=np.intp)
+        return ant_of, position_of, total_values, (sampling_time, sampling_calls, checks)
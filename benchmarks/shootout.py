@@ -0,0 +1,220 @@
+# benchmarks/shootout.py
+"""
+Comparaison des solveurs sur un corpus d'instances : qualité en fonction du temps
+Chaque configuration de Colony est exécutée avec plusieurs graines sous un budget de
+temps, à côté du glouton et des solveurs exacts (programmation dynamique, séparation
+et évaluation). Les profils « anytime » (meilleure valeur en fonction du temps écoulé),
+le temps pour atteindre la cible et les taux de succès sont écrits en CSV et en JSON.
+
+Usage:
+  python -m benchmarks.shootout data/instances -o results/shootout --seeds 5 --budget 10
+  python -m benchmarks.shootout data/instances --configs configs.json --target-gap 0.5
+configs.json : liste de paramètres de Colony, ex. [{"label": "aco-numpy", "engine": "numpy"}]
+Les courbes se tracent ensuite sans relancer : utils.visualizer.plot_anytime_profiles(fichier)
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import platform
+import statistics
+import time
+
+import numpy as np
+
+from ant_colony import Colony
+from knapsack import KnapsackProblem
+from utils.heuristics import (DP_MEMORY_LIMIT, branch_and_bound_solution, dynamic_programming_solution,
+                              greedy_solution_chunked)
+
+INSTANCE_EXTENSIONS = ('.csv', '.kbin')
+DEFAULT_CONFIGS = [
+    {'label': 'aco-python', 'engine': 'python'},
+    {'label': 'aco-numpy', 'engine': 'numpy'},
+    {'label': 'aco-exploitation', 'engine': 'numpy', 'alpha': 2.0, 'beta': 1.0, 'evaporation': 0.3},
+]
+PROFILE_FIELDS = ('instance', 'solver', 'seed', 'elapsed', 'iteration', 'value')
+SUMMARY_FIELDS = ('instance', 'solver', 'runs', 'successes', 'success_rate', 'median_time_to_target',
+                  'mean_final_value', 'best_final_value', 'mean_gap')
+
+def list_instances(directory):
+    """Fichiers d'instances (CSV, .kbin) du répertoire, triés par nom"""
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.endswith(INSTANCE_EXTENSIONS))
+
+def load_instance(path, capacity_ratio):
+    """Charge une instance; sans capacité enregistrée, capacity_ratio × poids total"""
+    problem = KnapsackProblem(path, None)
+    if problem.capacity is None:
+        problem.capacity = capacity_ratio * float(problem.table.weights.sum())
+    return problem
+
+def run_colony(problem, config, seed, budget, iterations):
+    """Exécute une configuration de Colony; retourne le profil [(temps, itération, valeur)]"""
+    params = {key: value for key, value in config.items() if key != 'label'}
+    start = time.perf_counter()
+    colony = Colony(problem, seed=seed, iterations=iterations, time_limit=budget,
+                    log_level=logging.DEBUG, **params)
+    colony.run()
+    # Un point par amélioration (trace de la colonie) : le profil est une fonction en escalier
+    setup = colony.start_time - start
+    return [(setup + elapsed, iteration, value) for elapsed, iteration, _, value in colony.improvement_trace]
+
+def run_exact(problem, budget, exact_max_items, dp_memory_limit):
+    """Glouton et solveurs exacts (déterministes, une seule exécution)
+    Retourne ({solveur: profil}, optimum prouvé ou None)"""
+    profiles = {}
+    start = time.perf_counter()
+    _, greedy_value = greedy_solution_chunked(problem.table, problem.capacity)
+    profiles['greedy'] = [(time.perf_counter() - start, 0, greedy_value)]
+
+    optimum = None
+    if len(problem.table) <= exact_max_items:
+        items = problem.items
+        # Poids entiers (instances générées) : la table de programmation dynamique n'a pas besoin de décimales
+        precision = 0 if np.all(np.mod(problem.table.weights, 1) == 0) else 2
+        start = time.perf_counter()
+        result = dynamic_programming_solution(items, problem.capacity, precision=precision,
+                                              memory_limit=dp_memory_limit)
+        if result is not None:
+            profiles['dynamic_programming'] = [(time.perf_counter() - start, 0, result[1])]
+            optimum = result[1]
+
+        start = time.perf_counter()
+        _, value, upper_bound, _ = branch_and_bound_solution(items, problem.capacity, time_limit=budget)
+        profiles['branch_and_bound'] = [(time.perf_counter() - start, 0, value)]
+        if optimum is None and value >= upper_bound - 1e-9 * max(1, abs(upper_bound)):
+            optimum = value
+    return profiles, optimum
+
+def time_to_target(profile, target):
+    """Premier instant où la valeur atteint la cible, None si jamais"""
+    for elapsed, _, value in profile:
+        if value >= target - 1e-9 * max(1, abs(target)):
+            return elapsed
+    return None
+
+def summarize(runs, references, target_gap):
+    """Taux de succès et temps pour atteindre la cible par (instance, solveur)"""
+    groups = {}
+    for run in runs:
+        groups.setdefault((run['instance'], run['solver']), []).append(run['profile'])
+
+    summary = []
+    for (instance, solver), profiles in groups.items():
+        reference = references[instance]['value']
+        target = reference * (1 - target_gap / 100)
+        finals = [profile[-1][2] if profile else 0 for profile in profiles]
+        times = [time_to_target(profile, target) for profile in profiles]
+        reached = [elapsed for elapsed in times if elapsed is not None]
+        summary.append({
+            'instance': instance,
+            'solver': solver,
+            'runs': len(profiles),
+            'successes': len(reached),
+            'success_rate': len(reached) / len(profiles),
+            'median_time_to_target': statistics.median(reached) if reached else None,
+            'mean_final_value': statistics.fmean(finals),
+            'best_final_value': max(finals),
+            'mean_gap': statistics.fmean((reference - value) / reference * 100 if reference else 0.0
+                                         for value in finals)
+        })
+    return summary
+
+def run_shootout(paths, configs, seeds, budget, iterations=10 ** 6, capacity_ratio=0.5, target_gap=0.0,
+                 exact_max_items=100_000, dp_memory_limit=DP_MEMORY_LIMIT):
+    runs = []
+    references = {}
+    for path in paths:
+        instance = os.path.basename(path)
+        problem = load_instance(path, capacity_ratio)
+        print(f"📦 {instance}: {len(problem.table)} objets, capacité {problem.capacity}")
+
+        exact_profiles, optimum = run_exact(problem, budget, exact_max_items, dp_memory_limit)
+        for solver, profile in exact_profiles.items():
+            runs.append({'instance': instance, 'solver': solver, 'seed': None, 'profile': profile})
+
+        for config in configs:
+            for seed in seeds:
+                profile = run_colony(problem, config, seed, budget, iterations)
+                runs.append({'instance': instance, 'solver': config['label'], 'seed': seed, 'profile': profile})
+                print(f"  {config['label']:20s} graine={seed}: {profile[-1][2] if profile else 0:.2f} "
+                      f"({profile[-1][0] if profile else 0:.2f}s)")
+
+        # Référence : optimum prouvé, sinon meilleure valeur trouvée par l'ensemble des solveurs
+        best_found = max((run['profile'][-1][2] for run in runs if run['instance'] == instance and run['profile']),
+                         default=0)
+        references[instance] = {
+            'value': optimum if optimum is not None else best_found,
+            'source': 'optimum' if optimum is not None else 'best_found',
+            'items': len(problem.table),
+            'capacity': problem.capacity
+        }
+
+    return {
+        'meta': {
+            'budget': budget,
+            'seeds': list(seeds),
+            'target_gap': target_gap,
+            'configs': configs,
+            'python': platform.python_version(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'references': references,
+        'summary': summarize(runs, references, target_gap),
+        'profiles': [dict(zip(PROFILE_FIELDS, (run['instance'], run['solver'], run['seed'], *point)))
+                     for run in runs for point in run['profile']]
+    }
+
+def write_results(results, prefix):
+    """Écrit <prefix>.json, <prefix>_profiles.csv et <prefix>_summary.csv"""
+    directory = os.path.dirname(prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(prefix + '.json', 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    for suffix, fields, rows in (('_profiles.csv', PROFILE_FIELDS, results['profiles']),
+                                 ('_summary.csv', SUMMARY_FIELDS, results['summary'])):
+        with open(prefix + suffix, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+def main():
+    parser = argparse.ArgumentParser(description="Comparaison qualité/temps des solveurs sur un corpus d'instances")
+    parser.add_argument('directory', help="Répertoire d'instances (.csv, .kbin)")
+    parser.add_argument('-o', '--output', default='shootout', help="Préfixe des fichiers de résultats")
+    parser.add_argument('--configs', help="Fichier JSON : liste de configurations de Colony (avec 'label')")
+    parser.add_argument('--seeds', type=int, default=3, help="Nombre de graines par configuration")
+    parser.add_argument('--budget', type=float, default=5.0, help="Budget de temps par exécution (s)")
+    parser.add_argument('--iterations', type=int, default=10 ** 6, help="Itérations maximales par exécution")
+    parser.add_argument('--capacity-ratio', type=float, default=0.5,
+                        help="Capacité / poids total des instances sans capacité enregistrée")
+    parser.add_argument('--target-gap', type=float, default=0.0,
+                        help="Écart (en %%) à la référence considéré comme un succès")
+    parser.add_argument('--exact-max-items', type=int, default=100_000,
+                        help="Taille maximale des instances passées aux solveurs exacts")
+    args = parser.parse_args()
+
+    configs = DEFAULT_CONFIGS
+    if args.configs:
+        with open(args.configs, 'r', encoding='utf-8') as file:
+            configs = json.load(file)
+    paths = list_instances(args.directory)
+    if not paths:
+        parser.error(f"aucune instance (.csv, .kbin) dans {args.directory}")
+
+    results = run_shootout(paths, configs, range(args.seeds), args.budget, args.iterations,
+                           args.capacity_ratio, args.target_gap, args.exact_max_items)
+    write_results(results, args.output)
+
+    for row in results['summary']:
+        time_text = f"{row['median_time_to_target']:.3f}s" if row['median_time_to_target'] is not None else "-"
+        print(f"{row['instance']:30s} {row['solver']:20s} succès {row['success_rate']:5.0%}  "
+              f"temps médian {time_text:>9s}  écart moyen {row['mean_gap']:.3f}%")
+    print(f"Résultats écrits dans {args.output}.json, {args.output}_profiles.csv et {args.output}_summary.csv")
+
+if __name__ == "__main__":
+    main()
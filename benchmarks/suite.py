@@ -0,0 +1,210 @@
+# benchmarks/suite.py
+"""
+Micro-benchmarks des fonctions critiques (ant_colony, knapsack, utils)
+Instances synthétiques à graine fixe, aucun accès réseau. Résultats en JSON
+(médiane, p95, opérations/s) et comparaison optionnelle à une référence enregistrée.
+
+Usage:
+  python -m benchmarks.suite                                 # toutes les tailles (10 à 1 000 000)
+  python -m benchmarks.suite --sizes 10,1000 -o results.json
+  python -m benchmarks.suite --save-baseline baseline.json   # enregistre la référence
+  python -m benchmarks.suite --baseline baseline.json --threshold 0.2
+Code de sortie 1 si une médiane dépasse la référence de plus de threshold (20% par défaut).
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from ant_colony import Ant, initialize_pheromones, update_pheromones
+from ant_colony.tables import SelectionTable
+from knapsack import ItemTable, KnapsackProblem
+from utils.heuristics import greedy_solution
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+SEED = 42
+NUM_ANTS = 30  # Solutions déposées par update_pheromones, comme une itération par défaut
+
+def make_table(n, seed=SEED):
+    """Instance synthétique non corrélée (poids et valeurs uniformes dans [1, 100])"""
+    rng = np.random.default_rng(seed)
+    weights = np.round(rng.uniform(1, 100, n), 2)
+    values = np.round(rng.uniform(1, 100, n), 2)
+    return ItemTable(np.arange(1, n + 1), weights, values)
+
+def make_problem(n, seed=SEED):
+    """Problème synthétique dont la capacité est le quart du poids total"""
+    table = make_table(n, seed)
+    return KnapsackProblem.from_table(table, float(table.weights.sum()) / 4)
+
+# Chaque benchmark prépare son état pour une taille n et retourne la fonction mesurée
+def bench_select_item(n, workdir):
+    problem = make_problem(n)
+    pheromones = initialize_pheromones(problem.table)
+    table = SelectionTable(problem.table, 1.0, 2.0).refresh(pheromones)
+    ant = Ant(problem.items, problem.capacity, pheromones, 1.0, 2.0, rng=random.Random(SEED), table=table)
+    candidates = problem.items
+    return lambda: ant.select_item(candidates)
+
+def bench_construct_solution(n, workdir):
+    problem = make_problem(n)
+    pheromones = initialize_pheromones(problem.table)
+    table = SelectionTable(problem.table, 1.0, 2.0).refresh(pheromones)
+    ant = Ant(problem.items, problem.capacity, pheromones, 1.0, 2.0, rng=random.Random(SEED), table=table)
+    table.sampler  # Roulette prototype construite une fois par itération, hors mesure
+    return ant.construct_solution
+
+def bench_update_pheromones(n, workdir):
+    problem = make_problem(n)
+    pheromones = initialize_pheromones(problem.table)
+    rng = np.random.default_rng(SEED)
+    size = max(1, n // 4)
+    solutions = [(rng.choice(n, size, replace=False), float(rng.uniform(1, 100))) for _ in range(NUM_ANTS)]
+    best_positions, best_value = max(solutions, key=lambda solution: solution[1])
+    return lambda: update_pheromones(pheromones, solutions, 0.5, best_positions, best_value)
+
+def bench_load_items(n, workdir):
+    table = make_table(n)
+    path = os.path.join(workdir, f"items_{n}.csv")
+    columns = np.column_stack((table.ids, table.weights, table.values))
+    np.savetxt(path, columns, fmt=('%d', '%.2f', '%.2f'), delimiter=',', header='id,weight,value', comments='')
+    problem = KnapsackProblem.from_table(table, 0)
+    return lambda: problem.load_items(path)
+
+def bench_evaluate(n, workdir):
+    problem = make_problem(n)
+    solution = problem.items[::2]
+    return lambda: problem.evaluate(solution)
+
+def bench_greedy_solution(n, workdir):
+    problem = make_problem(n)
+    items = problem.items
+    return lambda: greedy_solution(items, problem.capacity)
+
+BENCHMARKS = {
+    'ant.select_item': bench_select_item,
+    'ant.construct_solution': bench_construct_solution,
+    'pheromone.update_pheromones': bench_update_pheromones,
+    'problem.load_items': bench_load_items,
+    'problem.evaluate': bench_evaluate,
+    'heuristics.greedy_solution': bench_greedy_solution,
+}
+
+def measure(func, repeat=7, min_time=0.2, max_time=10.0):
+    """Chronomètre func (au moins repeat échantillons ou min_time secondes, au plus max_time)
+    Les appels très courts sont groupés par lots pour rester au-dessus de la résolution de l'horloge"""
+    start = time.perf_counter()
+    func()  # Échauffement (caches, allocations paresseuses)
+    first = time.perf_counter() - start
+    number = 1 if first >= 1e-3 else max(1, int(1e-3 / max(first, 1e-7)))
+
+    samples = []
+    budget_start = time.perf_counter()
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+        elapsed = time.perf_counter() - budget_start
+        if (len(samples) >= repeat and elapsed >= min_time) or (len(samples) >= 3 and elapsed >= max_time):
+            break
+
+    median = float(np.median(samples))
+    return {
+        'samples': len(samples),
+        'number': number,
+        'median': median,
+        'p95': float(np.percentile(samples, 95)),
+        'ops_per_sec': 1 / median if median > 0 else float('inf')
+    }
+
+def run_suite(names, sizes, repeat=7, min_time=0.2, max_time=10.0):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in names:
+            for n in sizes:
+                func = BENCHMARKS[name](n, workdir)
+                result = {'name': name, 'n': n, **measure(func, repeat, min_time, max_time)}
+                results.append(result)
+                print(f"  {name:30s} n={n:>9,d}  médiane={result['median'] * 1e3:10.4f} ms  "
+                      f"p95={result['p95'] * 1e3:10.4f} ms  {result['ops_per_sec']:12.1f} op/s",
+                      file=sys.stderr)
+    return {
+        'meta': {
+            'seed': SEED,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': results
+    }
+
+def compare(report, baseline, threshold):
+    """Retourne les régressions [(nom, n, médiane de référence, médiane, écart relatif)]"""
+    reference = {(result['name'], result['n']): result['median'] for result in baseline['results']}
+    regressions = []
+    for result in report['results']:
+        base = reference.get((result['name'], result['n']))
+        if base is None or base <= 0:
+            continue
+        change = (result['median'] - base) / base
+        result['baseline_median'] = base
+        result['change'] = change
+        if change > threshold:
+            regressions.append((result['name'], result['n'], base, result['median'], change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks des fonctions critiques")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="Tailles d'instance séparées par des virgules")
+    parser.add_argument('--only', action='append', choices=sorted(BENCHMARKS),
+                        help="Benchmark à exécuter (répétable; défaut: tous)")
+    parser.add_argument('--repeat', type=int, default=7, help="Nombre minimal d'échantillons")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Durée minimale par mesure (s)")
+    parser.add_argument('--max-time', type=float, default=10.0, help="Durée maximale par mesure (s)")
+    parser.add_argument('-o', '--output', help="Fichier JSON des résultats (défaut: sortie standard)")
+    parser.add_argument('--baseline', help="Référence JSON à laquelle comparer les médianes")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Régression relative tolérée sur la médiane (0.2 = +20%%)")
+    parser.add_argument('--save-baseline', help="Enregistre les résultats comme nouvelle référence")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    names = args.only or list(BENCHMARKS)
+    report = run_suite(names, sizes, args.repeat, args.min_time, args.max_time)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.threshold)
+        report['threshold'] = args.threshold
+        report['regressions'] = len(regressions)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as file:
+            file.write(output + "\n")
+
+    for name, n, base, median, change in regressions:
+        print(f"❌ Régression {name} n={n}: {base * 1e3:.4f} ms -> {median * 1e3:.4f} ms ({change:+.1%})",
+              file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
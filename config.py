@@ -9,13 +9,29 @@ BETA = 2.0              # Influence de l'heuristique (exploration)
 EVAPORATION = 0.5       # Taux d'évaporation des phéromones (0-1)
 NUM_ANTS = 30           # Nombre de fourmis par itération
 NUM_ITERATIONS = 100    # Nombre total d'itérations
+ENGINE = "python"       # Moteur de construction: "python" (fourmi par fourmi) ou "numpy" (vectorisé)
+WORKERS = 1             # Processus construisant les fourmis en parallèle (moteur "python")
+CANDIDATE_SIZE = None   # Liste de candidats : les K objets les plus attractifs (moteur "python", None: désactivée)
+
+# Critères d'arrêt anticipé (None: désactivé)
+PATIENCE = None         # Itérations sans amélioration avant arrêt
+TIME_LIMIT = None       # Budget de temps en secondes
+TARGET_VALUE = None     # Valeur à atteindre
+MIN_IMPROVEMENT = 0.0   # Amélioration relative minimale comptée comme progrès (ex: 0.001 = 0.1%)
 
 # Paramètres du problème
 KNAPSACK_CAPACITY = 50  # Capacité maximale du sac à dos
 DATA_FILE = "data/items.csv"  # Fichier contenant les objets
+USE_INSTANCE_CACHE = True     # Cache binaire à côté du fichier (<fichier>.cache/) pour éviter de relire le CSV
+INSTANCE_CACHE_DIR = None     # Répertoire de cache centralisé (None: à côté du fichier source)
 
 # Paramètres d'affichage
 SHOW_PROGRESS = True    # Afficher le progrès pendant l'exécution
+LOG_LEVEL = "INFO"      # Niveau de journalisation de main.py ("WARNING": silencieux)
+LOG_EVERY = 20          # Une ligne de progrès toutes les N itérations
+LOG_INTERVAL = 0.0      # Délai minimal (secondes) entre deux lignes de progrès
+INSTRUMENT = False      # Temps par phase et compteurs de la colonie (colony.get_metrics())
+PROFILE_MEMORY = False  # Rapport tracemalloc autour de Colony.run (main.py --profile-mem)
 PLOT_RESULTS = True     # Afficher les graphiques des résultats
 SAVE_RESULTS = False    # Sauvegarder les résultats dans un fichier
 
@@ -24,6 +40,10 @@ MIN_PHEROMONE = 0.01    # Niveau minimum de phéromone
 MAX_PHEROMONE = 10.0    # Niveau maximum de phéromone
 ELITE_FACTOR = 0.1      # Facteur de renforcement élitiste
 
+# Solveur exact de référence (programmation dynamique)
+DP_PRECISION = 2                    # Décimales conservées sur les poids (exact si les poids en ont au plus autant)
+DP_MEMORY_LIMIT = 256 * 1024 ** 2   # Budget mémoire (octets) au-delà duquel l'optimum n'est pas calculé
+
 # Configurations prédéfinies
 CONFIGS = {
     'exploitation': {
@@ -62,4 +82,9 @@ def print_config():
     print(f"  EVAPORATION: {EVAPORATION}")
     print(f"  Nombre de fourmis: {NUM_ANTS}")
     print(f"  Nombre d'itérations: {NUM_ITERATIONS}")
+    print(f"  Moteur de construction: {ENGINE}")
+    if CANDIDATE_SIZE is not None:
+        print(f"  Liste de candidats: {CANDIDATE_SIZE} objets")
+    if PATIENCE is not None or TIME_LIMIT is not None or TARGET_VALUE is not None:
+        print(f"  Arrêt anticipé: patience={PATIENCE}, temps={TIME_LIMIT}s, cible={TARGET_VALUE}")
     print(f"  Capacité du sac: {KNAPSACK_CAPACITY}")
\ No newline at end of file
@@ -15,7 +15,10 @@ from matplotlib.figure import Figure
 import numpy as np
 from datetime import datetime
 import csv
-import time
+import logging
+
+from ant_colony import Colony
+from knapsack import ItemTable, KnapsackProblem
 
 # Configuration par défaut
 class DefaultConfig:
@@ -394,49 +397,51 @@ class ACOKnapsackGUI:
     def _aco_worker(self):
         """Worker thread pour l'ACO"""
         try:
-            # Simulation d'algorithme ACO
             items = self.problem['items']
             capacity = self.params['capacity'].get()
             num_iterations = self.params['iterations'].get()
-            num_ants = self.params['num_ants'].get()
             
-            best_value = 0
-            best_solution = []
-            convergence_data = []
+            # Les positions des objets de la table correspondent aux indices de self.problem['items']
+            table = ItemTable(range(1, len(items) + 1),
+                              [item['weight'] for item in items],
+                              [item['value'] for item in items])
+            colony = Colony(
+                KnapsackProblem.from_table(table, capacity),
+                alpha=self.params['alpha'].get(),
+                beta=self.params['beta'].get(),
+                evaporation=self.params['evaporation'].get(),
+                num_ants=self.params['num_ants'].get(),
+                iterations=num_iterations,
+                log_level=logging.DEBUG
+            )
             
-            for iteration in range(num_iterations):
+            convergence_data = []
+            for stats in colony.iterate():
                 if not self.is_running:
                     break
                 
-                # Simulation d'une itération ACO
-                iteration_best = self._simulate_aco_iteration(items, capacity, num_ants)
-                
-                if iteration_best['value'] > best_value:
-                    best_value = iteration_best['value']
-                    best_solution = iteration_best['solution']
-                
                 convergence_data.append({
-                    'iteration': iteration + 1,
-                    'best_value': best_value,
-                    'current_value': iteration_best['value']
+                    'iteration': stats['iteration'],
+                    'best_value': stats['best_value'],
+                    'current_value': stats['iteration_best']
                 })
                 
                 # Mise à jour du progrès
-                progress = (iteration + 1) / num_iterations * 100
+                progress = stats['iteration'] / num_iterations * 100
                 self.results_queue.put({
                     'type': 'progress',
                     'progress': progress,
-                    'iteration': iteration + 1,
-                    'best_value': best_value
+                    'iteration': stats['iteration'],
+                    'best_value': stats['best_value']
                 })
-                
-                time.sleep(0.01)  # Simulation du temps de calcul
+            
+            best_solution = [] if colony.best_positions is None else colony.best_positions.tolist()
             
             # Résultats finaux
             self.results_queue.put({
                 'type': 'result',
                 'best_solution': best_solution,
-                'best_value': best_value,
+                'best_value': colony.best_value,
                 'convergence_data': convergence_data
             })
             
@@ -446,35 +451,6 @@ class ACOKnapsackGUI:
                 'message': str(e)
             })
 
-    def _simulate_aco_iteration(self, items, capacity, num_ants):
-        """Simule une itération de l'ACO"""
-        best_ant_value = 0
-        best_ant_solution = []
-        
-        for ant in range(num_ants):
-            # Sélection aléatoire d'objets basée sur ratio valeur/poids
-            solution = []
-            current_weight = 0
-            current_value = 0
-            
-            # Trier les objets par ratio valeur/poids
-            sorted_items = sorted(enumerate(items), 
-                                key=lambda x: x[1]['value'] / x[1]['weight'], 
-                                reverse=True)
-            
-            for idx, item in sorted_items:
-                if current_weight + item['weight'] <= capacity:
-                    if np.random.random() > 0.3:  # Probabilité de sélection
-                        solution.append(idx)
-                        current_weight += item['weight']
-                        current_value += item['value']
-            
-            if current_value > best_ant_value:
-                best_ant_value = current_value
-                best_ant_solution = solution
-        
-        return {'solution': best_ant_solution, 'value': best_ant_value}
-
     def stop_aco(self):
         """Arrête l'optimisation ACO"""
         self.is_running = False
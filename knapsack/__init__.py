@@ -1,5 +1,9 @@
 # knapsack/__init__.py
 from .item import Item
+from .loader import ItemFileError, load_item_table
 from .problem import KnapsackProblem
+from .table import ItemTable, within_capacity
 
-__all__ = ['Item', 'KnapsackProblem']
\ No newline at end of file
+# knapsack.binary_format (.kbin) et knapsack.generator sont importés explicitement :
+# ce sont aussi des outils en ligne de commande (python -m knapsack.<module>)
+__all__ = ['Item', 'ItemFileError', 'ItemTable', 'KnapsackProblem', 'load_item_table', 'within_capacity']
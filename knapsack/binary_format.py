@@ -0,0 +1,127 @@
+# knapsack/binary_format.py
+"""
+Format binaire d'instance projeté en mémoire (.kbin)
+Pour les catalogues trop grands pour être chargés en RAM : les colonnes sont lues
+directement depuis le fichier via mmap, page par page, à la demande.
+
+Disposition (petit-boutiste, tous les champs alignés sur 8 octets) :
+  octets  0-7   magic                b"KNAPBIN1"
+  octets  8-11  version              uint32 (1)
+  octets 12-15  réservé              uint32 (0)
+  octets 16-23  nombre d'objets n    uint64
+  octets 24-31  capacité             float64 (NaN si non renseignée)
+  octets 32-39  offset des poids     uint64
+  octets 40-47  offset des valeurs   uint64
+  octets 48-55  offset des ids       uint64
+  octets 56-63  réservé              uint64 (0)
+  puis les colonnes de largeur fixe : poids float64[n], valeurs float64[n], ids int64[n]
+
+Conversion depuis un CSV :
+  python -m knapsack.binary_format items.csv items.kbin [--capacity 50]
+"""
+
+import argparse
+import math
+import os
+import struct
+
+import numpy as np
+
+from .loader import DEFAULT_CHUNK_SIZE, _count_lines, iter_item_chunks
+from .table import ItemTable
+
+MAGIC = b"KNAPBIN1"
+VERSION = 1
+HEADER = struct.Struct('<8sIIQdQQQQ')
+HEADER_SIZE = HEADER.size  # 64 octets
+
+class BinaryInstanceWriter:
+    """Écriture en flux d'une instance .kbin : la mémoire utilisée ne dépend que de la taille des blocs
+    max_count borne le nombre d'objets (les colonnes sont réservées à l'avance)"""
+
+    def __init__(self, path, max_count, capacity=None):
+        self.path = path
+        self.max_count = max_count
+        self.capacity = capacity
+        self.count = 0
+        self.offsets = [HEADER_SIZE + column * 8 * max_count for column in range(3)]
+        self.file = open(path, 'wb')
+        self.file.truncate(HEADER_SIZE + 3 * 8 * max_count)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.file.close()
+            os.remove(self.path)
+
+    def write(self, weights, values, ids=None):
+        """Ajoute un bloc d'objets (ids dérivés du rang si None, à partir de 1)"""
+        size = len(weights)
+        if self.count + size > self.max_count:
+            raise ValueError(f"Plus de {self.max_count} objets écrits dans {self.path}")
+        if ids is None:
+            ids = np.arange(self.count + 1, self.count + size + 1, dtype=np.int64)
+        columns = (np.asarray(weights, dtype='<f8'), np.asarray(values, dtype='<f8'), np.asarray(ids, dtype='<i8'))
+        for offset, column in zip(self.offsets, columns):
+            self.file.seek(offset + 8 * self.count)
+            self.file.write(column.tobytes())
+        self.count += size
+
+    def close(self):
+        """Écrit l'en-tête définitif (nombre réel d'objets, capacité)"""
+        capacity = float('nan') if self.capacity is None else float(self.capacity)
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, 0, self.count, capacity, *self.offsets, 0))
+        self.file.close()
+
+def read_header(path):
+    """Lit et valide l'en-tête d'un fichier .kbin"""
+    with open(path, 'rb') as file:
+        raw = file.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path}: en-tête .kbin tronqué")
+    magic, version, _, count, capacity, weights_offset, values_offset, ids_offset, _ = HEADER.unpack(raw)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: fichier .kbin invalide (magic={magic!r}, version={version})")
+    return {
+        'count': count,
+        'capacity': None if math.isnan(capacity) else capacity,
+        'offsets': (weights_offset, values_offset, ids_offset)
+    }
+
+def open_binary_instance(path):
+    """Ouvre un fichier .kbin par projection mémoire; retourne (ItemTable, capacité ou None)"""
+    header = read_header(path)
+    count = header['count']
+    weights_offset, values_offset, ids_offset = header['offsets']
+    if count == 0:
+        return ItemTable([], [], []), header['capacity']
+    weights = np.memmap(path, dtype='<f8', mode='r', offset=weights_offset, shape=(count,))
+    values = np.memmap(path, dtype='<f8', mode='r', offset=values_offset, shape=(count,))
+    ids = np.memmap(path, dtype='<i8', mode='r', offset=ids_offset, shape=(count,))
+    return ItemTable(ids, weights, values, mapped=True), header['capacity']
+
+def convert_csv_to_binary(csv_path, binary_path, capacity=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Convertit un CSV d'objets en .kbin bloc par bloc; retourne le nombre d'objets écrits"""
+    with BinaryInstanceWriter(binary_path, _count_lines(csv_path), capacity) as writer:
+        for ids, weights, values, _ in iter_item_chunks(csv_path, chunk_size):
+            writer.write(weights, values, ids)
+        return writer.count
+
+def main():
+    parser = argparse.ArgumentParser(description="Conversion d'un CSV d'objets au format binaire .kbin")
+    parser.add_argument('source', help="Fichier CSV (id,weight,value ou name,weight,value)")
+    parser.add_argument('destination', help="Fichier .kbin à créer")
+    parser.add_argument('--capacity', type=float, help="Capacité du sac enregistrée dans l'en-tête")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Lignes lues par bloc")
+    args = parser.parse_args()
+
+    count = convert_csv_to_binary(args.source, args.destination, args.capacity, args.chunk_size)
+    print(f"{count} objets écrits dans {args.destination}")
+
+if __name__ == "__main__":
+    main()
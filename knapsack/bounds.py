@@ -0,0 +1,182 @@
+# knapsack/bounds.py
+"""
+Glouton et borne supérieure de Dantzig sur une ItemTable, en mémoire bornée pour les tables projetées
+Sans dépendance à utils (ni à matplotlib) : utilisé par le solveur et les processus du pool.
+"""
+
+import math
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20   # Positions lues par bloc dans les variantes par blocs (tables projetées en mémoire)
+BAND_SIZE = 1 << 16    # Objets triés gardés en mémoire à la fois (tables projetées)
+HISTOGRAM_BINS = 1024  # Intervalles de ratio par passe de recherche du ratio critique
+MAX_REFINEMENTS = 8    # Passes d'histogramme au plus (au-delà, les ratios ne se distinguent plus)
+
+def _chunk_ratios(weights, values):
+    """Ratios valeur/poids d'un bloc (0 pour les poids nuls, comme value_weight_ratio)"""
+    ratios = np.zeros(len(weights))
+    np.divide(values, weights, out=ratios, where=weights > 0)
+    return ratios
+
+def _accepted_chunks(table, accept, chunk_size, low=-np.inf, high=np.inf):
+    """Blocs (début, poids, valeurs, ratios, masque) des objets acceptés de ratio dans [low, high)"""
+    for start, stop in table.chunks(chunk_size):
+        weights = np.asarray(table.weights[start:stop])
+        values = np.asarray(table.values[start:stop])
+        ratios = _chunk_ratios(weights, values)
+        mask = accept(weights, values) & (ratios >= low) & (ratios < high)
+        yield start, weights, values, ratios, mask
+
+def _histogram_bracket(table, accept, capacity, chunk_size, band_size, high):
+    """Resserre par passes d'histogramme l'intervalle [low, split) de ratios contenant le ratio critique
+    jusqu'à au plus band_size objets; retourne (low, split), ou None si tous les objets tiennent"""
+    count, weight, smallest, largest = 0, 0.0, np.inf, -np.inf
+    for _, weights, _, ratios, mask in _accepted_chunks(table, accept, chunk_size, high=high):
+        if mask.any():
+            count += int(mask.sum())
+            weight += float(weights[mask].sum())
+            smallest = min(smallest, float(ratios[mask].min()))
+            largest = max(largest, float(ratios[mask].max()))
+    # Marge d'arrondi : les objets pris en bloc tiennent à coup sûr
+    capacity -= 1e-9 * max(1.0, abs(capacity))
+    if weight <= capacity:
+        return None
+    low, split = -np.inf, high
+    if count > band_size:
+        low, split = smallest, np.nextafter(largest, np.inf)
+        above = 0.0  # Poids des objets de ratio dans [split, high)
+        for _ in range(MAX_REFINEMENTS):
+            edges = np.linspace(low, split, HISTOGRAM_BINS + 1)
+            counts = np.zeros(HISTOGRAM_BINS)
+            sums = np.zeros(HISTOGRAM_BINS)
+            for _, weights, _, ratios, mask in _accepted_chunks(table, accept, chunk_size, low, split):
+                bins = np.clip(np.searchsorted(edges, ratios[mask], side='right') - 1, 0, HISTOGRAM_BINS - 1)
+                counts += np.bincount(bins, minlength=HISTOGRAM_BINS)
+                sums += np.bincount(bins, weights=weights[mask], minlength=HISTOGRAM_BINS)
+            # cumulative[b] : poids des objets de ratio >= edges[b]
+            cumulative = above + np.cumsum(sums[::-1])[::-1]
+            b = int(np.flatnonzero(cumulative > capacity)[-1])
+            if b + 1 < HISTOGRAM_BINS:
+                above = cumulative[b + 1]
+                split = edges[b + 1]
+            low = edges[b]
+            if counts[b] <= band_size:
+                break
+    return low, split
+
+def _ratio_band(table, accept, capacity, chunk_size, band_size, high=np.inf):
+    """Découpe les objets acceptés de ratio < high autour du ratio critique (poids cumulé par ratio
+    décroissant > capacity). Retourne (low, split, positions, ratios) :
+      - les objets de ratio dans [split, high) tiennent ensemble dans capacity;
+      - la bande [low, split) contient le ratio critique, triée (ratio décroissant, position croissante);
+      - les objets de ratio < low restent à examiner (low = -inf : aucun).
+    Table en mémoire : un seul tri de tous les objets. Table projetée (table.mapped) : passes
+    d'histogramme par blocs (_histogram_bracket); mémoire en O(chunk_size + band_size)."""
+    low, split = -np.inf, high
+    if table.mapped:
+        bracket = _histogram_bracket(table, accept, capacity, chunk_size, band_size, high)
+        if bracket is None:
+            return -np.inf, -np.inf, np.empty(0, dtype=np.intp), np.empty(0)
+        low, split = bracket
+
+    band_positions = []
+    band_ratios = []
+    for start, _, _, ratios, mask in _accepted_chunks(table, accept, chunk_size, low, split):
+        selected = np.flatnonzero(mask)
+        band_positions.append(selected + start)
+        band_ratios.append(ratios[selected])
+    positions = np.concatenate(band_positions) if band_positions else np.empty(0, dtype=np.intp)
+    ratios = np.concatenate(band_ratios) if band_ratios else np.empty(0)
+    order = np.lexsort((positions, -ratios))
+    return low, split, positions[order], ratios[order]
+
+def _take_range(table, accept, chunk_size, low, high):
+    """Positions, poids total et valeur totale des objets acceptés de ratio dans [low, high)"""
+    positions = []
+    weight = 0.0
+    value = 0.0
+    if low < high:
+        for start, weights, values, _, mask in _accepted_chunks(table, accept, chunk_size, low, high):
+            positions.append(np.flatnonzero(mask) + start)
+            weight += float(weights[mask].sum())
+            value += float(values[mask].sum())
+    return positions, weight, value
+
+def greedy_solution_chunked(table, capacity, chunk_size=CHUNK_SIZE, band_size=BAND_SIZE):
+    """Solution gloutonne de greedy_solution sur une ItemTable (lue par blocs si elle est projetée)
+    Retourne (positions choisies, croissantes, valeur totale)"""
+    chosen = []
+    total_weight = 0.0
+    total_value = 0.0
+    high = np.inf
+    while True:
+        # Le poids cumulé ne fait que croître : un objet qui ne tient plus ne tiendra jamais
+        fits = lambda weights, values, used=total_weight: used + weights <= capacity
+        low, split, positions, _ = _ratio_band(table, fits, capacity - total_weight, chunk_size, band_size, high)
+        taken, weight, value = _take_range(table, fits, chunk_size, split, high)
+        chosen.extend(taken)
+        total_weight += weight
+        total_value += value
+
+        # Bande : préfixes qui tiennent pris d'un bloc, objets devenus trop lourds écartés
+        weights = table.weights[positions]
+        values = table.values[positions]
+        while positions.size:
+            keep = total_weight + weights <= capacity
+            positions, weights, values = positions[keep], weights[keep], values[keep]
+            if not positions.size:
+                break
+            # Sommes cumulées séquentielles : mêmes arrondis que l'ajout objet par objet
+            cumulative = np.cumsum(np.concatenate(([total_weight], weights)))[1:]
+            k = int(np.searchsorted(cumulative, capacity, side='right'))
+            chosen.append(positions[:k])
+            total_weight = float(cumulative[k - 1])
+            total_value = float(np.cumsum(np.concatenate(([total_value], values[:k])))[-1])
+            positions, weights, values = positions[k + 1:], weights[k + 1:], values[k + 1:]
+
+        if low == -np.inf:
+            break
+        high = low
+    positions = np.sort(np.concatenate(chosen)) if chosen else np.empty(0, dtype=np.intp)
+    return positions.astype(np.intp, copy=False), total_value
+
+def dantzig_bound_chunked(table, capacity, chunk_size=CHUNK_SIZE, band_size=BAND_SIZE):
+    """Borne de Dantzig (voir dantzig_bound) sur une ItemTable (lue par blocs si elle est projetée)"""
+    bound = 0
+    for start, stop in table.chunks(chunk_size):
+        weights = np.asarray(table.weights[start:stop])
+        values = np.asarray(table.values[start:stop])
+        bound += float(values[(weights <= 0) & (values > 0)].sum())
+
+    remaining = capacity
+    high = np.inf
+    positive = lambda weights, values: (weights > 0) & (values > 0)
+    while True:
+        low, split, positions, _ = _ratio_band(table, positive, remaining, chunk_size, band_size, high)
+        _, weight, value = _take_range(table, positive, chunk_size, split, high)
+        bound += value
+        remaining -= weight
+
+        weights = table.weights[positions]
+        values = table.values[positions]
+        cumulative = np.cumsum(weights)
+        k = int(np.searchsorted(cumulative, remaining, side='right'))  # Objets entiers de la bande
+        bound += float(values[:k].sum())
+        if k < len(positions):
+            whole = float(cumulative[k - 1]) if k else 0.0
+            return bound + float(values[k]) * (remaining - whole) / float(weights[k])
+        remaining -= float(cumulative[-1]) if k else 0.0
+        if low == -np.inf:
+            return bound
+        high = low
+
+def upper_bound(table, capacity, chunk_size=CHUNK_SIZE):
+    """Borne supérieure de Dantzig d'une ItemTable, arrondie à l'inférieur si toutes les valeurs sont entières"""
+    bound = dantzig_bound_chunked(table, capacity, chunk_size)
+    integral = all(np.all(np.mod(table.values[start:stop], 1) == 0)
+                   for start, stop in table.chunks(chunk_size))
+    if integral:
+        # Toute solution a une valeur entière : la partie fractionnaire de la relaxation est inatteignable
+        bound = math.floor(bound + 1e-9)
+    return bound
@@ -0,0 +1,135 @@
+# knapsack/cache.py
+"""
+Cache binaire des fichiers d'objets
+Chaque fichier source a un répertoire compagnon (<fichier>.cache/) contenant une
+colonne .npy par champ et un meta.json de taille constante. Si le fichier nomme ses objets,
+names.npy contient les noms encodés en UTF-8 bout à bout et names_offsets.npy leurs bornes.
+Les chargements suivants projettent les colonnes en mémoire (mmap) sans aucune analyse du
+CSV; chaque nom n'est décodé qu'à l'accès.
+
+Règle d'invalidation : le cache est valide si le chemin et la taille du source sont
+identiques et que la date de modification l'est aussi; si seule la date diffère,
+l'empreinte SHA-256 du contenu est recalculée et le cache reste valide si elle correspond.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from .table import ItemTable
+
+CACHE_VERSION = 3
+CACHE_COLUMNS = ('ids', 'weights', 'values')
+NAMES_COLUMN = 'names'  # Colonnes optionnelles names (octets UTF-8) et names_offsets, signalées par meta['names']
+
+class MappedNames:
+    """Noms des objets lus dans le cache : octets UTF-8 et bornes int64 projetés, décodés à la demande"""
+
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start, stop = int(self.offsets[index]), int(self.offsets[index + 1])
+        return bytes(self.data[start:stop]).decode('utf-8')
+
+def _encode_names(names):
+    """Octets UTF-8 bout à bout et bornes (n + 1 entiers) d'une liste de noms"""
+    encoded = [name.encode('utf-8') for name in names]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(name) for name in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+def cache_directory(file_path, cache_dir=None):
+    """Répertoire de cache associé à un fichier source"""
+    source = os.path.abspath(file_path)
+    if cache_dir is None:
+        return source + '.cache'
+    # Cache centralisé : le nom inclut une empreinte du chemin pour éviter les collisions
+    path_hash = hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(source)}-{path_hash}.cache")
+
+def file_digest(file_path, block_size=1 << 20):
+    """Empreinte SHA-256 du contenu d'un fichier, lue par blocs"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _read_meta(directory):
+    try:
+        with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def _write_meta(directory, meta):
+    temporary = os.path.join(directory, 'meta.json.tmp')
+    with open(temporary, 'w', encoding='utf-8') as file:
+        json.dump(meta, file, ensure_ascii=False)
+    os.replace(temporary, os.path.join(directory, 'meta.json'))
+
+def load_cached_table(file_path, cache_dir=None):
+    """Retourne l'ItemTable projetée en mémoire depuis le cache, ou None si absent ou invalide"""
+    directory = cache_directory(file_path, cache_dir)
+    meta = _read_meta(directory)
+    if meta is None or meta.get('version') != CACHE_VERSION:
+        return None
+
+    stat = os.stat(file_path)
+    if meta.get('source') != os.path.abspath(file_path) or meta.get('size') != stat.st_size:
+        return None
+    if meta.get('mtime_ns') != stat.st_mtime_ns:
+        # Fichier touché mais peut-être inchangé : l'empreinte du contenu tranche
+        if meta.get('sha256') != file_digest(file_path):
+            return None
+        meta['mtime_ns'] = stat.st_mtime_ns
+        try:
+            _write_meta(directory, meta)
+        except OSError:
+            pass
+
+    try:
+        columns = [np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r') for name in CACHE_COLUMNS]
+        names = None
+        if meta.get('names'):
+            names = MappedNames(np.load(os.path.join(directory, f"{NAMES_COLUMN}.npy"), mmap_mode='r'),
+                                np.load(os.path.join(directory, f"{NAMES_COLUMN}_offsets.npy"), mmap_mode='r'))
+    except (OSError, ValueError):
+        return None
+    return ItemTable(*columns, names=names, mapped=True)
+
+def save_cached_table(file_path, table, cache_dir=None):
+    """Écrit les colonnes de la table et la clé du fichier source dans le cache"""
+    directory = cache_directory(file_path, cache_dir)
+    os.makedirs(directory, exist_ok=True)
+    stat = os.stat(file_path)
+
+    columns = {name: np.ascontiguousarray(getattr(table, name)) for name in CACHE_COLUMNS}
+    if table.names is not None:
+        columns[NAMES_COLUMN], columns[f"{NAMES_COLUMN}_offsets"] = _encode_names(table.names)
+    for name, column in columns.items():
+        temporary = os.path.join(directory, f"{name}.tmp.npy")
+        np.save(temporary, column)
+        os.replace(temporary, os.path.join(directory, f"{name}.npy"))
+
+    # meta.json est écrit en dernier : il valide l'ensemble du cache
+    _write_meta(directory, {
+        'version': CACHE_VERSION,
+        'source': os.path.abspath(file_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': file_digest(file_path),
+        'count': len(table),
+        'names': table.names is not None
+    })
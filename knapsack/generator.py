@@ -0,0 +1,158 @@
+# knapsack/generator.py
+"""
+Générateur d'instances synthétiques des classes classiques (Pisinger)
+Les objets sont produits et écrits par blocs : la mémoire utilisée ne dépend que de
+chunk_size, quel que soit n. Avec R l'amplitude des coefficients :
+  uncorrelated                 w, v ~ U[1, R]
+  weakly_correlated            w ~ U[1, R], v ~ U[w - R/10, w + R/10] (v >= 1)
+  strongly_correlated          w ~ U[1, R], v = w + R/10
+  inverse_strongly_correlated  v ~ U[1, R], w = v + R/10
+  subset_sum                   w ~ U[1, R], v = w
+  spanner                      multiples a·(w, v), a ~ U[1, m], d'un petit ensemble générateur
+                               (spanner_size objets de la classe spanner_base, réduits par 2/m)
+La capacité vaut capacity_ratio × poids total (arrondie à l'inférieur). Elle est écrite
+dans l'en-tête d'un fichier .kbin, ou dans <fichier>.meta.json à côté d'un CSV :
+KnapsackProblem(fichier, None) la reprend dans les deux cas.
+Une même graine et un même chunk_size produisent un fichier identique.
+
+Usage:
+  python -m knapsack.generator strongly_correlated -n 100000 -R 1000 -o data/strong.kbin
+  python -m knapsack.generator spanner -n 1000 --spanner-base weakly_correlated -o data/spanner.csv
+"""
+
+import argparse
+import json
+import math
+import os
+
+import numpy as np
+
+from .binary_format import BinaryInstanceWriter
+
+CLASSES = ('uncorrelated', 'weakly_correlated', 'strongly_correlated',
+           'inverse_strongly_correlated', 'subset_sum', 'spanner')
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+def _base_block(instance_class, rng, size, coefficient_range):
+    """Poids et valeurs entiers d'un bloc d'une classe non spanner"""
+    delta = coefficient_range // 10
+    if instance_class == 'inverse_strongly_correlated':
+        values = rng.integers(1, coefficient_range + 1, size)
+        return values + delta, values
+    weights = rng.integers(1, coefficient_range + 1, size)
+    if instance_class == 'uncorrelated':
+        values = rng.integers(1, coefficient_range + 1, size)
+    elif instance_class == 'weakly_correlated':
+        values = np.maximum(1, weights + rng.integers(-delta, delta + 1, size))
+    elif instance_class == 'strongly_correlated':
+        values = weights + delta
+    elif instance_class == 'subset_sum':
+        values = weights.copy()
+    else:
+        raise ValueError(f"Classe d'instance inconnue: {instance_class} (disponibles: {', '.join(CLASSES)})")
+    return weights, values
+
+def iter_instance_chunks(instance_class, n, coefficient_range=1000, seed=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                         spanner_size=2, spanner_multiplier=10, spanner_base='strongly_correlated'):
+    """Produit les blocs (poids, valeurs) d'une instance de n objets"""
+    if instance_class not in CLASSES:
+        raise ValueError(f"Classe d'instance inconnue: {instance_class} (disponibles: {', '.join(CLASSES)})")
+    rng = np.random.default_rng(seed)
+
+    if instance_class == 'spanner':
+        # Ensemble générateur réduit : chaque objet est un multiple de l'un de ses éléments
+        spanner_weights, spanner_values = _base_block(spanner_base, rng, spanner_size, coefficient_range)
+        spanner_weights = np.ceil(2 * spanner_weights / spanner_multiplier).astype(np.int64)
+        spanner_values = np.ceil(2 * spanner_values / spanner_multiplier).astype(np.int64)
+
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        if instance_class == 'spanner':
+            chosen = rng.integers(0, spanner_size, size)
+            multipliers = rng.integers(1, spanner_multiplier + 1, size)
+            yield multipliers * spanner_weights[chosen], multipliers * spanner_values[chosen]
+        else:
+            yield _base_block(instance_class, rng, size, coefficient_range)
+
+def metadata_path(path):
+    """Fichier de métadonnées associé à une instance CSV"""
+    return path + '.meta.json'
+
+def read_instance_metadata(path):
+    """Métadonnées (classe, graine, capacité...) d'une instance générée, ou None"""
+    try:
+        with open(metadata_path(path), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def generate_instance(path, instance_class, n, coefficient_range=1000, capacity_ratio=0.5, seed=None,
+                      chunk_size=DEFAULT_CHUNK_SIZE, **spanner_options):
+    """Écrit une instance en CSV ou en .kbin (selon l'extension) bloc par bloc; retourne ses métadonnées"""
+    binary = path.endswith('.kbin')
+    chunks = iter_instance_chunks(instance_class, n, coefficient_range, seed, chunk_size, **spanner_options)
+    total_weight = 0
+
+    if binary:
+        with BinaryInstanceWriter(path, n) as writer:
+            for weights, values in chunks:
+                total_weight += int(weights.sum())
+                writer.write(weights, values)
+            writer.capacity = math.floor(capacity_ratio * total_weight)
+    else:
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            file.write("id,weight,value\n")
+            next_id = 1
+            for weights, values in chunks:
+                total_weight += int(weights.sum())
+                ids = np.arange(next_id, next_id + len(weights))
+                np.savetxt(file, np.column_stack((ids, weights, values)), fmt='%d', delimiter=',')
+                next_id += len(weights)
+
+    metadata = {
+        'class': instance_class,
+        'n': n,
+        'coefficient_range': coefficient_range,
+        'capacity_ratio': capacity_ratio,
+        'capacity': math.floor(capacity_ratio * total_weight),
+        'total_weight': total_weight,
+        'seed': seed,
+        'chunk_size': chunk_size
+    }
+    if instance_class == 'spanner':
+        metadata.update(spanner_options)
+    if not binary:
+        with open(metadata_path(path), 'w', encoding='utf-8') as file:
+            json.dump(metadata, file, indent=2)
+    return metadata
+
+def main():
+    parser = argparse.ArgumentParser(description="Génération d'instances synthétiques du sac à dos")
+    parser.add_argument('instance_class', choices=CLASSES, help="Classe d'instance")
+    parser.add_argument('-n', '--items', type=int, required=True, help="Nombre d'objets")
+    parser.add_argument('-R', '--range', type=int, default=1000, dest='coefficient_range',
+                        help="Amplitude des poids et valeurs (défaut: 1000)")
+    parser.add_argument('--ratio', type=float, default=0.5, help="Capacité / poids total (défaut: 0.5)")
+    parser.add_argument('--seed', type=int, default=None, help="Graine du générateur")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Objets générés par bloc")
+    parser.add_argument('--spanner-size', type=int, default=2, help="Taille de l'ensemble générateur (spanner)")
+    parser.add_argument('--spanner-multiplier', type=int, default=10, help="Multiplicateur maximal (spanner)")
+    parser.add_argument('--spanner-base', default='strongly_correlated',
+                        choices=[name for name in CLASSES if name != 'spanner'],
+                        help="Classe de l'ensemble générateur (spanner)")
+    parser.add_argument('-o', '--output', required=True, help="Fichier à créer (.csv ou .kbin)")
+    args = parser.parse_args()
+
+    spanner_options = {}
+    if args.instance_class == 'spanner':
+        spanner_options = {'spanner_size': args.spanner_size, 'spanner_multiplier': args.spanner_multiplier,
+                           'spanner_base': args.spanner_base}
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    metadata = generate_instance(args.output, args.instance_class, args.items, args.coefficient_range,
+                                 args.ratio, args.seed, args.chunk_size, **spanner_options)
+    print(f"{metadata['n']} objets ({metadata['class']}) écrits dans {args.output}, capacité {metadata['capacity']}")
+
+if __name__ == "__main__":
+    main()
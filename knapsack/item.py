@@ -1,5 +1,7 @@
 # knapsack/item.py
 class Item:
+    __slots__ = ('id', 'weight', 'value')
+
     def __init__(self, id, weight, value):
         self.id = id
         self.weight = weight
@@ -0,0 +1,157 @@
+# knapsack/loader.py
+"""
+Chargement en bloc des fichiers d'objets
+Les colonnes id/weight/value sont lues par blocs directement dans des tableaux typés,
+sans créer d'objet Item par ligne. Formats acceptés :
+  id,weight,value        (format historique)
+  name,weight,value      (items.csv fourni, interface graphique) : id = numéro de ligne de données
+"""
+
+import csv
+from itertools import islice
+
+import numpy as np
+
+from .table import ItemTable
+
+DEFAULT_CHUNK_SIZE = 100_000  # Lignes lues par bloc (borne la mémoire de travail)
+MAX_REPORTED_ERRORS = 20      # Lignes invalides détaillées dans le message d'erreur
+
+class ItemFileError(ValueError):
+    """Fichier d'objets mal formé; errors contient des couples (numéro de ligne, message)"""
+
+    def __init__(self, file_path, errors, total_errors=None):
+        self.file_path = file_path
+        self.errors = errors
+        self.total_errors = total_errors if total_errors is not None else len(errors)
+        details = "\n".join(f"  ligne {line}: {message}" for line, message in errors)
+        if self.total_errors > len(errors):
+            details += f"\n  ... ({self.total_errors - len(errors)} autres)"
+        super().__init__(f"{self.total_errors} ligne(s) invalide(s) dans {file_path}:\n{details}")
+
+def _count_lines(file_path, block_size=1 << 20):
+    """Nombre de lignes du fichier (borne supérieure du nombre d'objets), en mémoire constante"""
+    count = 0
+    last = b'\n'
+    with open(file_path, 'rb') as file:
+        while True:
+            block = file.read(block_size)
+            if not block:
+                break
+            count += block.count(b'\n')
+            last = block[-1:]
+    return count + (last != b'\n')
+
+def _check_row(row, id_column, weight_column, value_column):
+    """Retourne le message d'erreur d'une ligne, ou None si elle est valide"""
+    width = max(column for column in (id_column, weight_column, value_column) if column is not None) + 1
+    if len(row) < width:
+        return f"{len(row)} champ(s) au lieu d'au moins {width}"
+    try:
+        if id_column is not None:
+            int(row[id_column])
+        weight = float(row[weight_column])
+        value = float(row[value_column])
+    except ValueError as e:
+        return str(e)
+    if not (np.isfinite(weight) and np.isfinite(value)):
+        return "poids ou valeur non fini"
+    return None
+
+def iter_item_chunks(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Parcourt un fichier CSV d'objets par blocs : (ids ou None, poids, valeurs, noms ou None)
+    ids vaut None si le fichier n'a pas de colonne id (ids à dériver du rang des lignes).
+    Lève ItemFileError (avec numéros de ligne) à la fin si des lignes sont mal formées"""
+    with open(file_path, 'r', encoding='utf-8', newline='') as file:
+        header = next(csv.reader([file.readline()]), [])
+        columns = {name.strip().lower(): index for index, name in enumerate(header)}
+        missing = [name for name in ('weight', 'value') if name not in columns]
+        if missing:
+            raise ItemFileError(file_path, [(1, f"colonne(s) manquante(s): {', '.join(missing)}")])
+
+        id_column = columns.get('id')
+        name_column = columns.get('name')
+        weight_column = columns['weight']
+        value_column = columns['value']
+
+        usecols = [weight_column, value_column]
+        dtype = [('weight', np.float64), ('value', np.float64)]
+        if id_column is not None:
+            usecols.append(id_column)
+            dtype.append(('id', np.int64))
+
+        line_number = 1
+        errors = []
+        total_errors = 0
+        while True:
+            raw_lines = list(islice(file, chunk_size))
+            if not raw_lines:
+                break
+            first_line = line_number + 1
+            line_number += len(raw_lines)
+            lines = [line for line in raw_lines if line.strip()]
+            if not lines:
+                continue
+
+            try:
+                block = np.loadtxt(lines, delimiter=',', quotechar='"', comments=None,
+                                   usecols=usecols, dtype=dtype, ndmin=1)
+                if not (np.isfinite(block['weight']).all() and np.isfinite(block['value']).all()):
+                    raise ValueError("poids ou valeur non fini")
+            except ValueError as e:
+                # Analyse ligne par ligne pour localiser précisément les erreurs du bloc
+                chunk_errors = []
+                reader = csv.reader(raw_lines)
+                for row in reader:
+                    if not row or not any(field.strip() for field in row):
+                        continue
+                    message = _check_row(row, id_column, weight_column, value_column)
+                    if message is not None:
+                        chunk_errors.append((first_line + reader.line_num - 1, message))
+                if not chunk_errors:
+                    chunk_errors.append((first_line, str(e)))
+                total_errors += len(chunk_errors)
+                errors.extend(chunk_errors[:MAX_REPORTED_ERRORS - len(errors)])
+                continue
+
+            if total_errors:
+                continue  # Le fichier est déjà invalide : on ne fait que rechercher les erreurs
+
+            names = [row[name_column] for row in csv.reader(lines)] if name_column is not None else None
+            yield (block['id'] if id_column is not None else None), block['weight'], block['value'], names
+
+    if total_errors:
+        raise ItemFileError(file_path, errors, total_errors)
+
+def load_item_table(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Charge un fichier CSV d'objets dans une ItemTable
+    Lève ItemFileError (avec numéros de ligne) si des lignes sont mal formées"""
+    # Tableaux préalloués à la taille maximale puis réduits sur place
+    max_rows = _count_lines(file_path)
+    weights = np.empty(max_rows, dtype=np.float64)
+    values = np.empty(max_rows, dtype=np.float64)
+    ids = None
+    names = None
+
+    count = 0
+    for chunk_ids, chunk_weights, chunk_values, chunk_names in iter_item_chunks(file_path, chunk_size):
+        size = len(chunk_weights)
+        weights[count:count + size] = chunk_weights
+        values[count:count + size] = chunk_values
+        if chunk_ids is not None:
+            if ids is None:
+                ids = np.empty(max_rows, dtype=np.int64)
+            ids[count:count + size] = chunk_ids
+        if chunk_names is not None:
+            if names is None:
+                names = []
+            names.extend(chunk_names)
+        count += size
+
+    weights.resize(count, refcheck=False)
+    values.resize(count, refcheck=False)
+    if ids is None:
+        ids = np.arange(1, count + 1, dtype=np.int64)
+    else:
+        ids.resize(count, refcheck=False)
+    return ItemTable(ids, weights, values, names=names)
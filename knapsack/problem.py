@@ -1,54 +1,119 @@
 # knapsack/problem.py
-import csv
-from .item import Item
+import numpy as np
+
+from .bounds import upper_bound
+from .cache import load_cached_table, save_cached_table
+from .loader import load_item_table
+from .table import ItemTable, within_capacity
+
+def _count(solution):
+    """Nombre d'objets d'une solution (liste d'Item, positions ou masque booléen)"""
+    if isinstance(solution, np.ndarray) and solution.dtype == bool:
+        return int(np.count_nonzero(solution))
+    return len(solution)
 
 class KnapsackProblem:
-    def __init__(self, file_path, capacity):
-        self.items = self.load_items(file_path)
-        self.capacity = capacity
+    def __init__(self, file_path, capacity, use_cache=False, cache_dir=None):
+        self.use_cache = use_cache    # Cache binaire projeté en mémoire (voir knapsack/cache.py)
+        self.cache_dir = cache_dir
+        self.file_capacity = None     # Capacité de l'en-tête .kbin ou du fichier <csv>.meta.json
+        self.table = self.load_items(file_path)
+        self.capacity = capacity if capacity is not None else self.file_capacity
+        self._items = None
+        self._upper_bound = None
+
+    @classmethod
+    def from_table(cls, table, capacity):
+        """Crée un problème à partir d'une table d'objets déjà chargée"""
+        problem = cls.__new__(cls)
+        problem.use_cache = False
+        problem.cache_dir = None
+        problem.file_capacity = None
+        problem.table = table
+        problem.capacity = capacity
+        problem._items = None
+        problem._upper_bound = None
+        return problem
+
+    @property
+    def items(self):
+        """Vues Item des objets, créées à la première utilisation (affichage, heuristiques)"""
+        if self._items is None:
+            self._items = self.table.items()
+        return self._items
+
+    def item_views(self, positions):
+        """Vues Item des positions données, sans matérialiser tout le catalogue"""
+        if self._items is not None:
+            return [self._items[i] for i in positions]
+        return [self.table.item(i) for i in positions]
+
+    def get_upper_bound(self):
+        """Borne supérieure de Dantzig (voir knapsack.bounds.upper_bound), calculée une fois par capacité"""
+        if self._upper_bound is None or self._upper_bound[0] != self.capacity:
+            self._upper_bound = (self.capacity, upper_bound(self.table, self.capacity))
+        return self._upper_bound[1]
+
+    def __getstate__(self):
+        # Les vues Item se reconstruisent à la demande : seules les colonnes sont transmises
+        state = self.__dict__.copy()
+        state['_items'] = None
+        return state
 
     def load_items(self, file_path):
-        """Charge les objets depuis un fichier CSV"""
-        items = []
+        """Charge les objets depuis un fichier CSV (id,weight,value ou name,weight,value)
+        ou les projette en mémoire depuis un fichier binaire .kbin (voir knapsack/binary_format.py)
+        Lève ItemFileError avec les numéros des lignes mal formées"""
+        # Imports différés : binary_format et generator sont aussi exécutés comme scripts (python -m)
+        from .binary_format import open_binary_instance
+        from .generator import read_instance_metadata
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    item = Item(int(row['id']), float(row['weight']), float(row['value']))
-                    items.append(item)
+            if file_path.endswith('.kbin'):
+                table, self.file_capacity = open_binary_instance(file_path)
+                return table
+            metadata = read_instance_metadata(file_path)
+            if metadata is not None:
+                self.file_capacity = metadata.get('capacity')
+            if self.use_cache:
+                table = load_cached_table(file_path, self.cache_dir)
+                if table is not None:
+                    return table
+            table = load_item_table(file_path)
         except FileNotFoundError:
             print(f"Erreur: Le fichier {file_path} n'a pas été trouvé.")
-            return []
-        except Exception as e:
-            print(f"Erreur lors du chargement du fichier: {e}")
-            return []
-        return items
+            return ItemTable([], [], [])
+
+        if self.use_cache:
+            try:
+                save_cached_table(file_path, table, self.cache_dir)
+            except OSError as e:
+                print(f"Avertissement: cache binaire non écrit ({e})")
+        return table
 
     def evaluate(self, solution):
-        """Évalue une solution et retourne sa valeur (0 si invalide)"""
-        total_weight = sum(item.weight for item in solution)
-        total_value = sum(item.value for item in solution)
-        if total_weight > self.capacity:
+        """Évalue une solution et retourne sa valeur (0 si invalide)
+        La solution peut être une liste d'Item, un tableau de positions ou un masque booléen"""
+        total_weight, total_value = self.table.totals(solution)
+        if not within_capacity(total_weight, self.capacity, _count(solution)):
             return 0  # Solution invalide
         return total_value
 
     def get_solution_info(self, solution):
         """Retourne les informations détaillées d'une solution"""
-        total_weight = sum(item.weight for item in solution)
-        total_value = sum(item.value for item in solution)
-        return total_weight, total_value
+        return self.table.totals(solution)
 
     def is_valid_solution(self, solution):
         """Vérifie si une solution respecte la contrainte de capacité"""
-        total_weight = sum(item.weight for item in solution)
-        return total_weight <= self.capacity
+        total_weight, _ = self.table.totals(solution)
+        return within_capacity(total_weight, self.capacity, _count(solution))
 
     def print_problem_info(self):
         """Affiche les informations du problème"""
         print(f"Problème du sac à dos:")
         print(f"- Capacité: {self.capacity}")
-        print(f"- Nombre d'objets: {len(self.items)}")
+        print(f"- Nombre d'objets: {len(self.table)}")
         print(f"- Objets disponibles:")
-        for item in self.items:
-            ratio = item.value / item.weight if item.weight > 0 else 0
-            print(f"  {item} (ratio: {ratio:.2f})")
\ No newline at end of file
+        names = self.table.names
+        for position, (item, ratio) in enumerate(zip(self.items, self.table.ratios.tolist())):
+            label = f" - {names[position]}" if names is not None else ""
+            print(f"  {item}{label} (ratio: {ratio:.2f})")
@@ -0,0 +1,75 @@
+# knapsack/table.py
+import sys
+
+import numpy as np
+from .item import Item
+
+def within_capacity(total_weight, capacity, count):
+    """Vrai si total_weight, somme flottante de count poids, respecte capacity
+    Tolérance bornée par l'erreur d'arrondi de la somme ((count + 1) ε × capacité) : 9.8 + 1.74 + 7.51 + 0.08
+    (19.130000000000003) tient dans 19.13, deux poids de 50.00000003 ne tiennent pas dans 100"""
+    return total_weight <= capacity + (count + 1) * sys.float_info.epsilon * abs(capacity)
+
+class ItemTable:
+    """Objets stockés en colonnes contiguës (ids, poids, valeurs); les Item sont des vues créées à la demande"""
+
+    def __init__(self, ids, weights, values, names=None, mapped=False):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.names = names  # Noms des objets (optionnel, format name,weight,value; liste ou colonne projetée)
+        self.mapped = mapped  # Colonnes projetées depuis un fichier (.kbin, cache) : parcours par blocs
+        self._ratios = None
+        self._positions = None
+
+    @classmethod
+    def from_items(cls, items):
+        """Construit une table à partir d'une liste d'objets Item"""
+        return cls([item.id for item in items],
+                   [item.weight for item in items],
+                   [item.value for item in items])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        return self.item(index)
+
+    @property
+    def ratios(self):
+        """Ratios valeur/poids (0 pour un poids nul), calculés une seule fois"""
+        if self._ratios is None:
+            self._ratios = np.divide(self.values, self.weights,
+                                     out=np.zeros_like(self.values), where=self.weights > 0)
+        return self._ratios
+
+    def chunks(self, chunk_size):
+        """Bornes (début, fin) des blocs contigus de la table, pour un traitement en mémoire bornée"""
+        for start in range(0, len(self), chunk_size):
+            yield start, min(start + chunk_size, len(self))
+
+    def item(self, index):
+        """Vue Item de l'objet à la position index"""
+        return Item(int(self.ids[index]), float(self.weights[index]), float(self.values[index]))
+
+    def items(self):
+        """Matérialise toutes les vues Item (affichage, compatibilité)"""
+        return [Item(*row) for row in zip(self.ids.tolist(), self.weights.tolist(), self.values.tolist())]
+
+    def positions(self, solution):
+        """Positions d'une solution donnée en masque booléen, positions entières ou liste d'Item"""
+        if isinstance(solution, np.ndarray):
+            if solution.dtype == bool:
+                return np.flatnonzero(solution)
+            return solution.astype(np.intp, copy=False)
+        if self._positions is None:
+            self._positions = {item_id: position for position, item_id in enumerate(self.ids.tolist())}
+        return np.fromiter((self._positions[item.id] for item in solution), dtype=np.intp, count=len(solution))
+
+    def totals(self, solution):
+        """Retourne (poids total, valeur totale) d'une solution"""
+        if isinstance(solution, np.ndarray):
+            positions = self.positions(solution)
+            return float(self.weights[positions].sum()), float(self.values[positions].sum())
+        # Liste d'objets Item : les attributs suffisent, aucune recherche dans la table
+        return sum(item.weight for item in solution), sum(item.value for item in solution)
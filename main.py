@@ -7,12 +7,15 @@ Date: 2025
 import os
 import sys
 import argparse
+import logging
 from knapsack import KnapsackProblem
 from ant_colony import Colony
-from utils import plot_convergence, greedy_solution, value_weight_ratio
+from utils import (plot_convergence, greedy_solution_chunked, value_weight_ratio,
+                   dynamic_programming_solution, dp_memory_estimate, optimality_gap)
+from utils.profiling import MemoryProfile, profile_call
 import config
 
-def print_solution(solution, value, weight, capacity):
+def print_solution(solution, value, weight, capacity, optimum=None, upper_bound=None):
     """Affiche les détails d'une solution"""
     print("\n" + "="*60)
     print("SOLUTION TROUVÉE")
@@ -21,6 +24,10 @@ def print_solution(solution, value, weight, capacity):
     print(f"Poids total: {weight}/{capacity}")
     print(f"Utilisation: {(weight/capacity)*100:.1f}%")
     print(f"Nombre d'objets sélectionnés: {len(solution)}")
+    if optimum is not None:
+        print(f"Optimum exact: {optimum} (écart: {optimality_gap(value, optimum):.2f}%)")
+    if upper_bound is not None:
+        print(f"Borne supérieure: {upper_bound:.2f} (écart maximal: {optimality_gap(value, upper_bound):.2f}%)")
     print("\nObjets dans le sac:")
     
     for item in sorted(solution, key=lambda x: x.id):
@@ -29,9 +36,37 @@ def print_solution(solution, value, weight, capacity):
     
     print("="*60)
 
-def compare_with_greedy(problem):
+def print_metrics(metrics):
+    """Affiche les temps par phase et les débits de la colonie instrumentée"""
+    if metrics is None:
+        return
+    print("\nInstrumentation de la colonie:")
+    for phase, seconds in metrics['timings'].items():
+        print(f"  {phase}: {seconds:.3f}s")
+    for name, count in metrics['counters'].items():
+        print(f"  {name}: {count}")
+    print(f"  Débit: {metrics['throughput']['ants_per_second']:.1f} fourmis/s, "
+          f"{metrics['throughput']['steps_per_second']:.1f} étapes/s")
+
+def compute_optimum(problem):
+    """Calcule l'optimum exact par programmation dynamique si la table tient dans le budget mémoire"""
+    # Budget vérifié sur la taille de la table, avant de créer les vues Item
+    if dp_memory_estimate(problem.table, problem.capacity, config.DP_PRECISION) > config.DP_MEMORY_LIMIT:
+        result = None
+    else:
+        result = dynamic_programming_solution(problem.items, problem.capacity,
+                                              precision=config.DP_PRECISION,
+                                              memory_limit=config.DP_MEMORY_LIMIT)
+    if result is None:
+        print("ℹ️  Optimum exact non calculé: la programmation dynamique dépasse le budget mémoire")
+        return None
+    return result[1]
+
+def compare_with_greedy(problem, optimum=None):
     """Compare avec la solution gloutonne"""
-    greedy_sol, greedy_val = greedy_solution(problem.items, problem.capacity)
+    # Parcours par blocs : fonctionne aussi sur les instances .kbin projetées en mémoire
+    greedy_positions, greedy_val = greedy_solution_chunked(problem.table, problem.capacity)
+    greedy_sol = problem.item_views(greedy_positions)
     greedy_weight = sum(item.weight for item in greedy_sol)
     
     print("\n" + "-"*60)
@@ -41,6 +76,9 @@ def compare_with_greedy(problem):
     print(f"  Valeur: {greedy_val}")
     print(f"  Poids: {greedy_weight}/{problem.capacity}")
     print(f"  Objets: {[item.id for item in greedy_sol]}")
+    if optimum is not None:
+        print(f"Optimum exact (programmation dynamique): {optimum}")
+        print(f"  Écart du glouton à l'optimum: {optimality_gap(greedy_val, optimum):.2f}%")
     
     return greedy_val, greedy_weight
 
@@ -103,6 +141,7 @@ def print_config_info():
     print(f"Alpha: {config.ALPHA}")
     print(f"Beta: {config.BETA}")
     print(f"Évaporation: {config.EVAPORATION}")
+    print(f"Moteur: {config.ENGINE}")
     print("="*40)
 
 def run_experiment():
@@ -114,13 +153,15 @@ def run_experiment():
     if not os.path.exists(config.DATA_FILE):
         print(f"❌ Erreur: Le fichier {config.DATA_FILE} n'existe pas!")
         print("Veuillez créer le fichier avec les objets à analyser.")
-        print(f"Format attendu: id,weight,value")
+        print(f"Format attendu: id,weight,value (ou name,weight,value), ou fichier binaire .kbin")
         return False
     
     # Initialisation du problème
     try:
-        problem = KnapsackProblem(config.DATA_FILE, config.KNAPSACK_CAPACITY)
-        if not problem.items:
+        problem = KnapsackProblem(config.DATA_FILE, config.KNAPSACK_CAPACITY,
+                                  use_cache=config.USE_INSTANCE_CACHE,
+                                  cache_dir=config.INSTANCE_CACHE_DIR)
+        if not len(problem.table):
             print("❌ Aucun objet chargé. Vérifiez le fichier de données.")
             return False
             
@@ -130,9 +171,16 @@ def run_experiment():
         print(f"❌ Erreur lors de l'initialisation du problème: {e}")
         return False
     
+    # Optimum exact de référence (si la programmation dynamique tient en mémoire)
+    try:
+        optimum = compute_optimum(problem)
+    except Exception as e:
+        print(f"⚠️  Erreur lors du calcul de l'optimum exact: {e}")
+        optimum = None
+    
     # Comparaison avec la solution gloutonne
     try:
-        greedy_value, greedy_weight = compare_with_greedy(problem)
+        greedy_value, greedy_weight = compare_with_greedy(problem, optimum)
     except Exception as e:
         print(f"⚠️  Erreur lors du calcul de la solution gloutonne: {e}")
         greedy_value, greedy_weight = 0, 0
@@ -149,16 +197,34 @@ def run_experiment():
         beta=config.BETA,
         evaporation=config.EVAPORATION,
         num_ants=config.NUM_ANTS,
-        iterations=config.NUM_ITERATIONS
+        iterations=config.NUM_ITERATIONS,
+        engine=config.ENGINE,
+        workers=config.WORKERS,
+        candidate_size=config.CANDIDATE_SIZE,
+        patience=config.PATIENCE,
+        time_limit=config.TIME_LIMIT,
+        target_value=config.TARGET_VALUE,
+        min_improvement=config.MIN_IMPROVEMENT,
+        log_every=config.LOG_EVERY,
+        log_interval=config.LOG_INTERVAL,
+        instrument=config.INSTRUMENT
     )
     
     try:
         # Exécution de l'algorithme
-        best_solution, best_value, history = colony.run()
+        if config.PROFILE_MEMORY:
+            with MemoryProfile() as memory:
+                best_solution, best_value, history = colony.run()
+            print("\n" + memory.report())
+        else:
+            best_solution, best_value, history = colony.run()
+        print(f"Itérations effectuées: {len(history)}/{config.NUM_ITERATIONS} (arrêt: {colony.stop_reason})")
+        print_metrics(colony.get_metrics())
         
         if best_solution:
             weight, value = problem.get_solution_info(best_solution)
-            print_solution(best_solution, best_value, weight, config.KNAPSACK_CAPACITY)
+            print_solution(best_solution, best_value, weight, config.KNAPSACK_CAPACITY, optimum,
+                           colony.upper_bound)
             
             # Comparaison des performances
             if greedy_value > 0:
@@ -191,6 +257,10 @@ Exemples d'utilisation:
   python main.py              # Exécution normale
   python main.py -i           # Mode interactif
   python main.py -c           # Afficher la configuration
+  python main.py -e numpy     # Moteur de construction vectorisé
+  python main.py -p 20 -t 10  # Arrêt après 20 itérations sans amélioration ou 10 s
+  python main.py --profile    # Profil cProfile (profile.pstats + profile.txt)
+  python main.py --profile-mem  # Sites d'allocation pendant Colony.run (tracemalloc)
   python main.py --help       # Afficher cette aide
         """
     )
@@ -203,9 +273,45 @@ Exemples d'utilisation:
                        action='store_true',
                        help='Afficher la configuration actuelle')
     
+    parser.add_argument('-e', '--engine',
+                       choices=['python', 'numpy'],
+                       help=f'Moteur de construction des solutions (défaut: {config.ENGINE})')
+    
+    parser.add_argument('-k', '--candidates', type=int, metavar='K',
+                       help="Liste de candidats : les fourmis tirent parmi les K objets les plus attractifs")
+    
+    parser.add_argument('-p', '--patience', type=int,
+                       help="Arrêt après N itérations sans amélioration")
+    
+    parser.add_argument('-t', '--time-limit', type=float,
+                       help="Budget de temps de l'optimisation (secondes)")
+    
+    parser.add_argument('-q', '--quiet', action='store_true',
+                       help="N'affiche pas le déroulement de la colonie")
+    
+    parser.add_argument('--profile', nargs='?', const='profile.pstats', metavar='FICHIER',
+                       help="Profile l'expérience avec cProfile (défaut: profile.pstats + résumé .txt)")
+    
+    parser.add_argument('--profile-mem', action='store_true',
+                       help="Instantanés tracemalloc au début et à la fin de Colony.run")
+    
     args = parser.parse_args()
     
+    # Journalisation de la colonie (logger 'ant_colony')
+    logging.basicConfig(level=logging.WARNING if args.quiet else config.LOG_LEVEL, format='%(message)s')
+    
     # Gestion des arguments
+    if args.engine:
+        config.ENGINE = args.engine
+    if args.candidates is not None:
+        config.CANDIDATE_SIZE = args.candidates
+    if args.patience is not None:
+        config.PATIENCE = args.patience
+    if args.time_limit is not None:
+        config.TIME_LIMIT = args.time_limit
+    if args.profile_mem:
+        config.PROFILE_MEMORY = True
+    
     if args.config:
         print_config_info()
         return
@@ -215,7 +321,11 @@ Exemples d'utilisation:
             return
     
     # Exécution de l'expérience
-    success = run_experiment()
+    if args.profile:
+        success, summary_path = profile_call(run_experiment, args.profile)
+        print(f"\n⏱️  Profil écrit dans '{args.profile}' (résumé trié: '{summary_path}')")
+    else:
+        success = run_experiment()
     
     if success:
         print("\n✅ Optimisation terminée avec succès!")
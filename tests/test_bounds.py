@@ -0,0 +1,52 @@
+# tests/test_bounds.py
+import numpy as np
+import pytest
+
+from knapsack import ItemTable, KnapsackProblem
+from knapsack import bounds
+from knapsack.binary_format import BinaryInstanceWriter
+
+def write_instance(path, n=5000, seed=0):
+    """Écrit une instance .kbin aléatoire; retourne (poids, valeurs)"""
+    rng = np.random.default_rng(seed)
+    weights = np.round(rng.uniform(1, 50, n), 2)
+    values = np.round(rng.uniform(1, 100, n), 2)
+    with BinaryInstanceWriter(str(path), n) as writer:
+        writer.write(weights, values)
+    return weights, values
+
+def spy_histogram(monkeypatch):
+    """Compte les appels à la recherche par histogramme (tables projetées)"""
+    calls = []
+    original = bounds._histogram_bracket
+    def wrapper(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+    monkeypatch.setattr(bounds, '_histogram_bracket', wrapper)
+    return calls
+
+def test_kbin_table_takes_histogram_path(tmp_path, monkeypatch):
+    weights, values = write_instance(tmp_path / 'items.kbin')
+    problem = KnapsackProblem(str(tmp_path / 'items.kbin'), 2000)
+    assert problem.table.mapped
+
+    calls = spy_histogram(monkeypatch)
+    positions, value = bounds.greedy_solution_chunked(problem.table, 2000, chunk_size=512, band_size=64)
+    bound = bounds.dantzig_bound_chunked(problem.table, 2000, chunk_size=512, band_size=64)
+    assert calls and all(table is problem.table for table in calls)
+
+    # Même résultat que le tri unique de la table en mémoire
+    in_memory = ItemTable(np.arange(1, len(weights) + 1), weights, values)
+    calls.clear()
+    expected_positions, expected_value = bounds.greedy_solution_chunked(in_memory, 2000)
+    assert not calls
+    np.testing.assert_array_equal(positions, expected_positions)
+    assert value == expected_value
+    assert bound == pytest.approx(bounds.dantzig_bound_chunked(in_memory, 2000))
+
+def test_cached_table_is_mapped(tmp_path):
+    path = tmp_path / 'items.csv'
+    path.write_text("id,weight,value\n1,2.5,3\n2,4,1\n3,1,1\n", encoding='utf-8')
+    KnapsackProblem(str(path), 5, use_cache=True)
+    problem = KnapsackProblem(str(path), 5, use_cache=True)
+    assert problem.table.mapped
@@ -0,0 +1,24 @@
+# tests/test_cache.py
+import json
+import os
+
+from knapsack import KnapsackProblem
+from knapsack.cache import cache_directory
+
+def test_names_cached_as_utf8_column(tmp_path):
+    path = tmp_path / 'items.csv'
+    names = ['Carte.du monde', 'lampe', 'écharpe en laine très longue' * 20]
+    rows = ''.join(f"{name},{i + 1},{i + 2}\n" for i, name in enumerate(names))
+    path.write_text("name,weight,value\n" + rows, encoding='utf-8')
+
+    KnapsackProblem(str(path), 5, use_cache=True)
+    problem = KnapsackProblem(str(path), 5, use_cache=True)
+    assert problem.table.mapped
+    assert list(problem.table.names) == names
+    assert problem.table.names[-1] == names[-1]
+
+    # meta.json ne dépend pas des noms; la colonne coûte leurs octets UTF-8, pas n × le plus long
+    directory = cache_directory(str(path))
+    with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as file:
+        assert json.load(file)['names'] is True
+    assert os.path.getsize(os.path.join(directory, 'names.npy')) <= 128 + sum(len(name.encode()) for name in names)
@@ -0,0 +1,22 @@
+# tests/test_colony.py
+import time
+
+import numpy as np
+
+from ant_colony import Colony
+from knapsack import ItemTable, KnapsackProblem
+
+def test_improvement_trace_restarts_with_each_run():
+    rng = np.random.default_rng(0)
+    table = ItemTable(np.arange(1, 51), rng.uniform(1, 20, 50), rng.uniform(1, 50, 50))
+    colony = Colony(KnapsackProblem.from_table(table, 100), num_ants=5, iterations=3, seed=1)
+    colony.run()
+    assert colony.improvement_trace
+
+    # Seconde exécution sur la même colonie : seuls ses points, mesurés depuis son propre début
+    colony.best_value = 0
+    colony.run()
+    elapsed_since_start = time.perf_counter() - colony.start_time
+    assert colony.improvement_trace
+    assert colony.improvement_trace[0][1] == 1
+    assert all(0 <= elapsed <= elapsed_since_start for elapsed, *_ in colony.improvement_trace)
@@ -0,0 +1,27 @@
+# tests/test_heuristics.py
+import pytest
+
+from knapsack import Item, ItemTable, KnapsackProblem
+from utils.heuristics import branch_and_bound_solution
+
+def make_problem(weights, values, capacity):
+    items = [Item(i, weight, value) for i, (weight, value) in enumerate(zip(weights, values))]
+    return items, KnapsackProblem.from_table(ItemTable.from_items(items), capacity)
+
+def test_branch_and_bound_accepts_rounding_at_capacity():
+    # 9.8 + 1.74 + 7.51 + 0.08 = 19.130000000000003 en flottants
+    items, problem = make_problem([9.8, 5.7, 1.74, 7.47, 8.91, 4.98, 7.54, 7.51, 7.27, 0.08],
+                                  [10, 6, 6.6, 1.4, 7.5, 2.8, 3.1, 9.3, 2.1, 5], 19.13)
+    solution, value, bound, _ = branch_and_bound_solution(items, 19.13)
+    assert value == pytest.approx(30.9)
+    assert bound == pytest.approx(30.9)
+    assert sorted(item.id for item in solution) == [0, 2, 7, 9]
+    assert problem.is_valid_solution(solution)
+    assert problem.evaluate(solution) == pytest.approx(value)
+
+def test_branch_and_bound_rejects_real_overweight():
+    items, problem = make_problem([50.00000003, 50.00000003], [10, 10], 100)
+    solution, value, bound, _ = branch_and_bound_solution(items, 100)
+    assert value == 10
+    assert problem.is_valid_solution(solution)
+    assert not problem.is_valid_solution(items)
@@ -0,0 +1,9 @@
+# tests/test_profiling.py
+from utils.profiling import profile_call
+
+def test_profile_call_creates_missing_directory(tmp_path):
+    stats_path = tmp_path / 'runs' / 'v1.2' / 'profile.pstats'
+    result, summary_path = profile_call(lambda: 42, str(stats_path))
+    assert result == 42
+    assert stats_path.exists()
+    assert summary_path == str(tmp_path / 'runs' / 'v1.2' / 'profile.txt')
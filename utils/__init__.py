@@ -1,12 +1,26 @@
 # utils/__init__.py
-from .heuristics import value_weight_ratio, greedy_solution, calculate_efficiency
-from .visualizer import plot_convergence, plot_comparison, plot_solution_distribution
+from .heuristics import (value_weight_ratio, greedy_solution, calculate_efficiency,
+                         dynamic_programming_solution, dp_memory_estimate, optimality_gap,
+                         dantzig_bound, branch_and_bound_solution,
+                         greedy_solution_chunked, dantzig_bound_chunked, upper_bound)
+from .visualizer import (plot_convergence, plot_comparison, plot_solution_distribution,
+                         load_anytime_profiles, plot_anytime_profiles)
 
 __all__ = [
     'value_weight_ratio', 
     'greedy_solution', 
     'calculate_efficiency',
+    'dynamic_programming_solution',
+    'dp_memory_estimate',
+    'optimality_gap',
+    'dantzig_bound',
+    'branch_and_bound_solution',
+    'greedy_solution_chunked',
+    'dantzig_bound_chunked',
+    'upper_bound',
     'plot_convergence', 
     'plot_comparison', 
-    'plot_solution_distribution'
+    'plot_solution_distribution',
+    'load_anytime_profiles',
+    'plot_anytime_profiles'
 ]
\ No newline at end of file
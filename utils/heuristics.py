@@ -1,4 +1,17 @@
 # utils/heuristics.py
+import math
+import sys
+import time
+from bisect import bisect_right
+import numpy as np
+
+# Variantes par blocs (tables projetées en mémoire) : définies dans knapsack.bounds, qui n'importe pas
+# utils (et donc pas matplotlib), et réexportées ici
+from knapsack.bounds import (BAND_SIZE, CHUNK_SIZE, dantzig_bound_chunked, greedy_solution_chunked,
+                             upper_bound)
+from knapsack.table import within_capacity
+
+DP_MEMORY_LIMIT = 256 * 1024 ** 2  # Budget mémoire par défaut de la programmation dynamique (octets)
 
 def value_weight_ratio(item):
     """Calcule le ratio valeur/poids d'un objet"""
@@ -27,4 +40,167 @@ def calculate_efficiency(items):
 
 def get_best_items_by_ratio(items, n=5):
     """Retourne les n meilleurs objets selon leur ratio valeur/poids"""
-    return sorted(items, key=value_weight_ratio, reverse=True)[:n]
\ No newline at end of file
+    return sorted(items, key=value_weight_ratio, reverse=True)[:n]
+
+def dantzig_bound(items, capacity):
+    """Borne supérieure de Dantzig : relaxation linéaire sur les objets triés par ratio décroissant"""
+    # Les objets de poids nul (ratio 0 par convention) ne consomment pas de capacité
+    bound = sum(item.value for item in items if item.weight <= 0 and item.value > 0)
+    remaining = capacity
+    candidates = (item for item in items if item.weight > 0 and item.value > 0)
+    for item in sorted(candidates, key=value_weight_ratio, reverse=True):
+        if item.weight <= remaining:
+            bound += item.value
+            remaining -= item.weight
+        else:
+            bound += item.value * remaining / item.weight
+            break
+    return bound
+
+def _scale_instance(items, capacity, precision):
+    """Convertit poids et capacité en entiers à 10^-precision près"""
+    scale = 10 ** precision
+    # Poids arrondis au supérieur et capacité à l'inférieur : une solution entière reste réalisable
+    weights = [max(0, math.ceil(item.weight * scale - 1e-9)) for item in items]
+    return weights, int(math.floor(capacity * scale + 1e-9))
+
+def dp_memory_estimate(items, capacity, precision=0):
+    """Estime la mémoire (octets) de la table de valeurs et de la table de décisions compressée"""
+    _, scaled_capacity = _scale_instance([], capacity, precision)
+    row_bytes = (scaled_capacity + 8) // 8
+    return len(items) * row_bytes + (scaled_capacity + 1) * 8
+
+def dynamic_programming_solution(items, capacity, precision=0, memory_limit=DP_MEMORY_LIMIT):
+    """Solution exacte du sac à dos 0/1 par programmation dynamique
+    Exacte si les poids ont au plus `precision` décimales; retourne None si la table
+    dépasse memory_limit (environ n×C/8 octets de décisions + un tableau de C valeurs)"""
+    if capacity < 0:
+        return [], 0
+    if dp_memory_estimate(items, capacity, precision) > memory_limit:
+        return None
+
+    weights, scaled_capacity = _scale_instance(items, capacity, precision)
+    size = scaled_capacity + 1
+
+    # Table de valeurs roulante (1-D) et une ligne de bits de décision par objet
+    best = np.zeros(size)
+    decisions = np.zeros((len(items), (size + 7) // 8), dtype=np.uint8)
+    take = np.zeros(size, dtype=bool)
+
+    for i, (item, weight) in enumerate(zip(items, weights)):
+        if weight > scaled_capacity or item.value <= 0:
+            continue
+        take[:] = False
+        candidate = best[:size - weight] + item.value
+        take[weight:] = candidate > best[weight:]
+        best[weight:][take[weight:]] = candidate[take[weight:]]
+        decisions[i] = np.packbits(take)
+
+    # Reconstruction des objets choisis en remontant la table de décisions
+    solution = []
+    remaining = scaled_capacity
+    for i in range(len(items) - 1, -1, -1):
+        if (decisions[i, remaining >> 3] >> (7 - (remaining & 7))) & 1:
+            solution.append(items[i])
+            remaining -= weights[i]
+    solution.reverse()
+
+    return solution, sum(item.value for item in solution)
+
+def optimality_gap(value, optimum):
+    """Écart relatif (en %) entre une valeur et l'optimum"""
+    if not optimum:
+        return 0.0
+    return (optimum - value) / optimum * 100
+
+def branch_and_bound_solution(items, capacity, incumbent=None, node_limit=1_000_000, time_limit=None):
+    """Séparation et évaluation en profondeur (itérative) avec bornes de Dantzig
+    incumbent: solution initiale (objets, valeur), par défaut la solution gloutonne
+    Retourne (solution, valeur, borne supérieure prouvée, nombre de nœuds)"""
+    start_time = time.time()
+
+    # Objets de poids nul toujours pris, objets inutiles ou trop lourds écartés
+    free_items = [item for item in items if item.weight <= 0 and item.value > 0]
+    free_value = sum(item.value for item in free_items)
+    candidates = sorted((item for item in items
+                         if item.weight > 0 and within_capacity(item.weight, capacity, 1) and item.value > 0),
+                        key=value_weight_ratio, reverse=True)
+    n = len(candidates)
+    weights = [item.weight for item in candidates]
+    values = [item.value for item in candidates]
+    ratios = [value_weight_ratio(item) for item in candidates]
+    prefix_weights = [0.0]
+    prefix_values = [0.0]
+    for weight, value in zip(weights, values):
+        prefix_weights.append(prefix_weights[-1] + weight)
+        prefix_values.append(prefix_values[-1] + value)
+    # Les tests de la recherche portent sur des différences de sommes préfixes : marge à la mesure de leur
+    # erreur d'arrondi. Chaque solution retenue est ensuite vérifiée comme KnapsackProblem.evaluate.
+    tolerance = (n + 1) * sys.float_info.epsilon * max(abs(capacity), prefix_weights[-1])
+
+    # Valeurs entières : les bornes peuvent être arrondies à l'inférieur
+    integral = all(float(item.value).is_integer() for item in candidates)
+
+    def completion(i, residual):
+        """Remplissage glouton depuis i : (dernier objet entier k, valeur entière, borne fractionnaire)"""
+        k = bisect_right(prefix_weights, prefix_weights[i] + residual + tolerance, lo=i) - 1
+        whole = prefix_values[k] - prefix_values[i]
+        bound = whole
+        if k < n:
+            bound += max(residual - (prefix_weights[k] - prefix_weights[i]), 0.0) * ratios[k]
+        if integral:
+            bound = math.floor(bound + 1e-9)
+        return k, whole, bound
+
+    if incumbent is None:
+        incumbent = greedy_solution(items, capacity)
+    best_solution, best_value = list(incumbent[0]), incumbent[1]
+    best_path = None  # (choix empilés, i, k) de la meilleure complétion trouvée par la recherche
+
+    def solution_of(chosen, i, k):
+        """Objets de la solution : choix empilés complétés par les objets i à k - 1"""
+        indices = list(range(i, k))
+        while chosen is not None:
+            indices.append(chosen[0])
+            chosen = chosen[1]
+        return free_items + [candidates[j] for j in sorted(indices)]
+
+    def feasible(solution):
+        """Même somme et même règle que KnapsackProblem.evaluate"""
+        return within_capacity(sum(item.weight for item in solution), capacity, len(solution))
+
+    # Nœud : (objet à décider, poids, valeur, choix sous forme de liste chaînée (index, parent))
+    stack = [(0, 0.0, free_value, None)]
+    nodes = 0
+    while stack:
+        if nodes >= node_limit or (time_limit is not None and nodes % 1024 == 0
+                                   and time.time() - start_time > time_limit):
+            break
+        i, weight, value, chosen = stack.pop()
+        nodes += 1
+
+        k, whole, bound = completion(i, capacity - weight)
+        complete = k == n
+        if value + whole > best_value:
+            if feasible(solution_of(chosen, i, k)):
+                best_value = value + whole
+                best_path = (chosen, i, k)
+            else:
+                complete = False  # Complétion refusée par la vérification exacte : on continue à séparer
+        if value + bound <= best_value + 1e-9 or complete or i == n:
+            continue  # Élagage, ou tous les objets restants tiennent : complétion optimale
+
+        stack.append((i + 1, weight, value, chosen))
+        if weight + weights[i] <= capacity + tolerance:
+            stack.append((i + 1, weight + weights[i], value + values[i], (i, chosen)))
+
+    # Borne prouvée : meilleure valeur, ou borne des nœuds encore ouverts si la recherche a été interrompue
+    upper_bound = best_value
+    for i, weight, value, _ in stack:
+        upper_bound = max(upper_bound, value + completion(i, capacity - weight)[2])
+
+    if best_path is not None:
+        best_solution = solution_of(*best_path)
+        best_value = sum(item.value for item in best_solution)
+
+    return best_solution, best_value, upper_bound, nodes
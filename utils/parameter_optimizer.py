@@ -3,17 +3,62 @@ Optimisation automatique des paramètres ACO
 Utilise différentes stratégies pour trouver les meilleurs paramètres
 """
 
+import logging
 import random
 import numpy as np
 from typing import Dict, List, Tuple, Any
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 import json
 import os
 
+# Contexte des processus d'évaluation (problème transmis une seule fois par processus)
+_evaluation_context = {}
+
+def _init_evaluation_worker(problem, engine):
+    _evaluation_context['problem'] = problem
+    _evaluation_context['engine'] = engine
+
+def _evaluate_in_worker(task):
+    params, seed = task
+    return run_trial(_evaluation_context['problem'], params, seed, _evaluation_context['engine'])
+
+def run_trial(problem, params, seed=None, engine='python'):
+    """Exécute une colonie avec les paramètres donnés et retourne sa meilleure valeur"""
+    from ant_colony.colony import Colony
+    
+    # Création de la colonie avec les paramètres
+    colony = Colony(
+        problem=problem,
+        alpha=params['alpha'],
+        beta=params['beta'],
+        evaporation=params['evaporation'],
+        num_ants=params['num_ants'],
+        iterations=params['iterations'],
+        engine=engine,
+        seed=seed,
+        patience=params.get('patience'),
+        time_limit=params.get('time_limit'),
+        log_level=logging.DEBUG  # Déroulement des essais visible seulement en mode débogage
+    )
+    
+    try:
+        # Exécution silencieuse
+        best_solution, best_value, _ = colony.run()
+        return best_value if best_value else 0
+    except Exception as e:
+        print(f"Erreur lors de l'évaluation: {e}")
+        return 0
+
 class ParameterOptimizer:
-    def __init__(self, problem, base_iterations=50, optimization_budget=20):
+    def __init__(self, problem, base_iterations=50, optimization_budget=20, engine='python',
+                 max_workers=1, seed=None, patience=None):
         self.problem = problem
+        self.engine = engine
+        self.max_workers = max_workers  # Processus d'évaluation en parallèle
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.evaluation_count = 0
         self.base_iterations = base_iterations
         self.optimization_budget = optimization_budget
         self.best_params = None
@@ -30,7 +75,8 @@ class ParameterOptimizer:
         
         # Paramètres fixes
         self.fixed_params = {
-            'iterations': self.base_iterations
+            'iterations': self.base_iterations,
+            'patience': patience  # Arrêt anticipé des essais qui stagnent (None: toutes les itérations)
         }
 
     def random_search(self, n_trials=10) -> Dict[str, Any]:
@@ -40,13 +86,11 @@ class ParameterOptimizer:
         best_params = None
         best_score = 0
         
-        for trial in range(n_trials):
-            # Génération aléatoire des paramètres
-            params = self._generate_random_params()
-            
-            # Évaluation
-            score = self._evaluate_parameters(params)
-            
+        # Génération aléatoire des paramètres puis évaluation (parallèle si max_workers > 1)
+        trials = [self._generate_random_params() for _ in range(n_trials)]
+        scores = self._evaluate_batch(trials)
+        
+        for trial, (params, score) in enumerate(zip(trials, scores)):
             print(f"  Essai {trial+1}/{n_trials}: Score = {score:.2f}")
             
             if score > best_score:
@@ -80,37 +124,36 @@ class ParameterOptimizer:
         
         print(f"  Total de combinaisons: {total_combinations}")
         
-        combination = 0
+        combinations = []
         for alpha in param_grids['alpha']:
             for beta in param_grids['beta']:
                 for evaporation in param_grids['evaporation']:
                     for num_ants in param_grids['num_ants']:
-                        combination += 1
-                        
-                        params = {
+                        combinations.append({
                             'alpha': alpha,
                             'beta': beta,
                             'evaporation': evaporation,
                             'num_ants': num_ants,
                             **self.fixed_params
-                        }
-                        
-                        score = self._evaluate_parameters(params)
-                        
-                        if combination % max(1, total_combinations // 10) == 0:
-                            print(f"  Progression: {combination}/{total_combinations} ({100*combination/total_combinations:.1f}%)")
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_params = params.copy()
-                            
-                        self.optimization_history.append({
-                            'method': 'grid_search',
-                            'combination': combination,
-                            'params': params.copy(),
-                            'score': score
                         })
         
+        scores = self._evaluate_batch(combinations)
+        
+        for combination, (params, score) in enumerate(zip(combinations, scores), 1):
+            if combination % max(1, total_combinations // 10) == 0:
+                print(f"  Progression: {combination}/{total_combinations} ({100*combination/total_combinations:.1f}%)")
+            
+            if score > best_score:
+                best_score = score
+                best_params = params.copy()
+                
+            self.optimization_history.append({
+                'method': 'grid_search',
+                'combination': combination,
+                'params': params.copy(),
+                'score': score
+            })
+        
         return best_params, best_score
 
     def bayesian_optimization(self, n_trials=15) -> Dict[str, Any]:
@@ -162,10 +205,9 @@ class ParameterOptimizer:
         
         # Phase 1: Exploration large
         exploration_trials = n_trials // 2
-        for trial in range(exploration_trials):
-            params = self._generate_random_params()
-            score = self._evaluate_parameters(params)
-            
+        explorations = [self._generate_random_params() for _ in range(exploration_trials)]
+        scores = self._evaluate_batch(explorations)
+        for trial, (params, score) in enumerate(zip(explorations, scores)):
             if score > best_score:
                 best_score = score
                 best_params = params.copy()
@@ -201,7 +243,7 @@ class ParameterOptimizer:
         start_time = time.time()
         
         print(f"🚀 Début de l'optimisation des paramètres (méthode: {method})")
-        print(f"⚙️  Problème: {len(self.problem.items)} objets, capacité {self.problem.capacity}")
+        print(f"⚙️  Problème: {len(self.problem.table)} objets, capacité {self.problem.capacity}, moteur {self.engine}")
         print("=" * 60)
         
         if method == 'random':
@@ -235,34 +277,38 @@ class ParameterOptimizer:
         params = {}
         for param, (min_val, max_val) in self.param_ranges.items():
             if param == 'num_ants':
-                params[param] = random.randint(int(min_val), int(max_val))
+                params[param] = self.rng.randint(int(min_val), int(max_val))
             else:
-                params[param] = random.uniform(min_val, max_val)
+                params[param] = self.rng.uniform(min_val, max_val)
         
         params.update(self.fixed_params)
         return params
 
     def _evaluate_parameters(self, params: Dict[str, Any]) -> float:
         """Évalue un ensemble de paramètres"""
-        from ant_colony.colony import Colony
-        
-        # Création de la colonie avec les paramètres
-        colony = Colony(
-            problem=self.problem,
-            alpha=params['alpha'],
-            beta=params['beta'],
-            evaporation=params['evaporation'],
-            num_ants=params['num_ants'],
-            iterations=params['iterations']
-        )
-        
-        try:
-            # Exécution silencieuse
-            best_solution, best_value, _ = colony.run()
-            return best_value if best_value else 0
-        except Exception as e:
-            print(f"Erreur lors de l'évaluation: {e}")
-            return 0
+        return run_trial(self.problem, params, self._next_trial_seed(), self.engine)
+
+    def _evaluate_batch(self, params_list: List[Dict[str, Any]]) -> List[float]:
+        """Évalue des ensembles de paramètres indépendants, en parallèle si max_workers > 1"""
+        # Les graines sont attribuées dans l'ordre des essais : résultats indépendants du parallélisme
+        tasks = [(params, self._next_trial_seed()) for params in params_list]
+        if self.max_workers <= 1 or len(tasks) <= 1:
+            return [run_trial(self.problem, params, seed, self.engine) for params, seed in tasks]
+        
+        # Borne supérieure calculée une fois ici : le problème la transmet, en cache, aux processus
+        self.problem.get_upper_bound()
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_evaluation_worker,
+                                 initargs=(self.problem, self.engine)) as executor:
+            return list(executor.map(_evaluate_in_worker, tasks))
+
+    def _next_trial_seed(self):
+        """Graine propre à chaque évaluation (None si l'optimiseur n'est pas initialisé avec une graine)"""
+        index = self.evaluation_count
+        self.evaluation_count += 1
+        if self.seed is None:
+            return None
+        return int(np.random.SeedSequence([self.seed, index]).generate_state(1, dtype=np.uint64)[0])
 
     def _select_next_candidate(self, evaluated_params: List[Dict], evaluated_scores: List[float]) -> Dict[str, Any]:
         """Sélectionne le prochain candidat pour l'optimisation bayésienne"""
@@ -309,7 +355,7 @@ class ParameterOptimizer:
         for param, (min_val, max_val) in self.param_ranges.items():
             if param in perturbed:
                 range_size = max_val - min_val
-                perturbation = random.gauss(0, intensity * range_size)
+                perturbation = self.rng.gauss(0, intensity * range_size)
                 
                 new_value = perturbed[param] + perturbation
                 new_value = max(min_val, min(max_val, new_value))
@@ -329,7 +375,7 @@ class ParameterOptimizer:
             'optimization_history': self.optimization_history,
             'param_ranges': self.param_ranges,
             'problem_info': {
-                'num_items': len(self.problem.items),
+                'num_items': len(self.problem.table),
                 'capacity': self.problem.capacity
             }
         }
@@ -0,0 +1,69 @@
+# utils/profiling.py
+"""
+Profilage de l'optimisation : temps CPU (cProfile/pstats) et allocations (tracemalloc)
+Utilisé par main.py --profile et --profile-mem
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+
+def profile_call(func, stats_path, sort='cumulative', limit=30):
+    """Exécute func sous cProfile, écrit stats_path (.pstats) et un résumé texte trié à côté
+    Retourne (résultat de func, chemin du résumé)"""
+    # Répertoire créé avant l'expérience : un chemin invalide échoue tout de suite, pas après le calcul
+    directory = os.path.dirname(stats_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func)
+    finally:
+        profiler.dump_stats(stats_path)
+
+    summary_path = os.path.splitext(stats_path)[0] + '.txt'
+    buffer = io.StringIO()
+    stats = pstats.Stats(stats_path, stream=buffer)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    with open(summary_path, 'w', encoding='utf-8') as file:
+        file.write(buffer.getvalue())
+    return result, summary_path
+
+class MemoryProfile:
+    """Instantanés tracemalloc au début et à la fin d'un bloc; report() liste les principaux sites d'allocation"""
+
+    def __init__(self, limit=15, frames=1):
+        self.limit = limit
+        self.frames = frames
+        self.start_snapshot = None
+        self.end_snapshot = None
+        self.peak = 0
+
+    def __enter__(self):
+        self.was_tracing = tracemalloc.is_tracing()
+        if not self.was_tracing:
+            tracemalloc.start(self.frames)
+        tracemalloc.reset_peak()
+        self.start_snapshot = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.end_snapshot = tracemalloc.take_snapshot()
+        self.peak = tracemalloc.get_traced_memory()[1]
+        if not self.was_tracing:
+            tracemalloc.stop()
+
+    def report(self):
+        """Texte : pic mémoire et sites dont l'allocation nette a le plus augmenté pendant le bloc"""
+        ignored = [tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                   tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>')]
+        start = self.start_snapshot.filter_traces(ignored)
+        end = self.end_snapshot.filter_traces(ignored)
+        lines = [f"Pic mémoire tracé: {self.peak / 1024 ** 2:.2f} Mo",
+                 f"Principaux sites d'allocation (écart fin - début, top {self.limit}):"]
+        for difference in end.compare_to(start, 'lineno')[:self.limit]:
+            lines.append(f"  {difference}")
+        return "\n".join(lines)
@@ -1,4 +1,6 @@
 # utils/visualizer.py
+import csv
+import json
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -14,15 +16,19 @@ def plot_convergence(history, title="Évolution de la meilleure solution (conver
     plt.tight_layout()
     plt.show()
 
-def plot_comparison(histories, labels, title="Comparaison des algorithmes"):
-    """Compare plusieurs exécutions ou algorithmes"""
+def plot_comparison(histories, labels, title="Comparaison des algorithmes", x_values=None, xlabel="Itération"):
+    """Compare plusieurs exécutions ou algorithmes
+    x_values: abscisses de chaque courbe (ex. temps écoulé); les courbes sont alors tracées en escalier"""
     plt.figure(figsize=(12, 6))
     
     colors = ['b-', 'r-', 'g-', 'm-', 'c-']
     for i, (history, label) in enumerate(zip(histories, labels)):
-        plt.plot(history, colors[i % len(colors)], linewidth=2, label=label)
+        if x_values is None:
+            plt.plot(history, colors[i % len(colors)], linewidth=2, label=label)
+        else:
+            plt.step(x_values[i], history, colors[i % len(colors)], where='post', linewidth=2, label=label)
     
-    plt.xlabel("Itération")
+    plt.xlabel(xlabel)
     plt.ylabel("Valeur du sac")
     plt.title(title)
     plt.legend()
@@ -30,6 +36,47 @@ def plot_comparison(histories, labels, title="Comparaison des algorithmes"):
     plt.tight_layout()
     plt.show()
 
+def load_anytime_profiles(path, instance=None):
+    """Lit les profils anytime de benchmarks/shootout.py (.json ou _profiles.csv)
+    Retourne (courbes, étiquettes, abscisses) : médiane des graines de chaque solveur,
+    au format attendu par plot_comparison"""
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as file:
+            rows = json.load(file)['profiles']
+    else:
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            rows = list(csv.DictReader(file))
+    if instance is None and rows:
+        instance = rows[0]['instance']
+
+    runs = {}
+    for row in rows:
+        if row['instance'] == instance:
+            runs.setdefault(row['solver'], {}).setdefault(row['seed'], []).append(
+                (float(row['elapsed']), float(row['value'])))
+
+    histories, labels, x_values = [], [], []
+    for solver, seeds in runs.items():
+        times = np.unique([elapsed for profile in seeds.values() for elapsed, _ in profile])
+        # Valeur de chaque graine à chaque instant (fonction en escalier, NaN avant le premier point)
+        curves = []
+        for profile in seeds.values():
+            profile.sort()
+            elapsed = np.array([point[0] for point in profile])
+            values = np.array([point[1] for point in profile])
+            positions = np.searchsorted(elapsed, times, side='right') - 1
+            curves.append(np.where(positions >= 0, values[np.maximum(positions, 0)], np.nan))
+        histories.append(np.nanmedian(curves, axis=0))
+        labels.append(f"{solver} ({len(seeds)} graine(s))" if len(seeds) > 1 else solver)
+        x_values.append(times)
+    return histories, labels, x_values
+
+def plot_anytime_profiles(path, instance=None):
+    """Trace les profils qualité/temps d'un fichier de résultats sans relancer les solveurs"""
+    histories, labels, x_values = load_anytime_profiles(path, instance)
+    plot_comparison(histories, labels, title=f"Profils anytime{f' - {instance}' if instance else ''}",
+                    x_values=x_values, xlabel="Temps écoulé (s)")
+
 def plot_solution_distribution(iteration_stats):
     """Affiche la distribution des solutions par itération"""
     iterations = [stat['iteration'] for stat in iteration_stats]
@@ -52,7 +99,7 @@ def plot_solution_distribution(iteration_stats):
 def plot_pheromone_levels(pheromones, items):
     """Visualise les niveaux de phéromones"""
     item_ids = [item.id for item in items]
-    pheromone_levels = [pheromones[item.id] for item in items]
+    pheromone_levels = pheromones.levels[pheromones.indices(items)]
     
     plt.figure(figsize=(10, 6))
     bars = plt.bar(item_ids, pheromone_levels)
@@ -61,7 +108,7 @@ def plot_pheromone_levels(pheromones, items):
     plt.title("Niveaux de phéromones par objet")
     
     # Colorer selon le niveau
-    max_pheromone = max(pheromone_levels)
+    max_pheromone = pheromone_levels.max()
     for bar, level in zip(bars, pheromone_levels):
         bar.set_color(plt.cm.viridis(level / max_pheromone))
     